@@ -0,0 +1,8 @@
+"""WSGI config for the ERP Marocaine backend."""
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+application = get_wsgi_application()
@@ -0,0 +1,178 @@
+from decimal import Decimal
+
+from django import forms
+from django.contrib import admin
+from django.core.cache import cache
+from django.db.models import BigIntegerField, Case, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils.translation import gettext_lazy as _
+
+from libs.core.models import Company
+
+from .models import Account, AccountType, Journal, JournalEntry, JournalEntryLine
+
+
+class AccountTypeFilter(admin.SimpleListFilter):
+    """Relation filter whose choices come from a short-TTL cache instead of
+    a distinct query on every changelist render."""
+
+    title = _('account type')
+    parameter_name = 'account_type'
+
+    def lookups(self, request, model_admin):
+        return cache.get_or_set(
+            'admin_account_type_choices',
+            lambda: [
+                (str(pk), f'{code} - {name}')
+                for pk, code, name in AccountType.objects.filter(is_active=True)
+                .values_list('id', 'code', 'name')
+            ],
+            60,
+        )
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(account_type_id=self.value())
+        return queryset
+
+
+class CompanyFilter(admin.SimpleListFilter):
+    title = _('company')
+    parameter_name = 'company'
+
+    def lookups(self, request, model_admin):
+        return cache.get_or_set(
+            'admin_company_choices',
+            lambda: list(
+                Company.objects.filter(is_active=True).values_list('id', 'name')
+            ),
+            60,
+        )
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(company_id=self.value())
+        return queryset
+
+
+@admin.register(AccountType)
+class AccountTypeAdmin(admin.ModelAdmin):
+    list_display = ['code', 'name', 'category', 'normal_balance', 'level',
+                    'is_active']
+    list_filter = ['category', 'normal_balance', 'is_active', 'company']
+    search_fields = ['code', 'name', 'name_arabic']
+    ordering = ['code']
+
+
+@admin.register(Account)
+class AccountAdmin(admin.ModelAdmin):
+    list_display = ['code', 'name', 'account_type', 'currency',
+                    'current_balance_display', 'allow_posting', 'is_active']
+    list_filter = [AccountTypeFilter, 'currency', 'allow_posting', 'is_active',
+                   CompanyFilter]
+    search_fields = ['code', 'name', 'name_arabic']
+    ordering = ['code']
+
+    def get_queryset(self, request):
+        # One aggregated query for the whole changelist instead of one
+        # per-account SUM when rendering the balance column. The sign
+        # dispatch on normal_balance matches what the posting path
+        # stores in current_cents (see _update_account_balances), so
+        # the annotation and the fallback agree.
+        posted = Q(journal_lines__journal_entry__state='POSTED')
+        debit = Sum('journal_lines__debit_cents', filter=posted)
+        credit = Sum('journal_lines__credit_cents', filter=posted)
+        return super().get_queryset(request).select_related('account_type').annotate(
+            _balance_annot=Coalesce(
+                Case(
+                    When(normal_balance='DEBIT', then=debit - credit),
+                    default=credit - debit,
+                    output_field=BigIntegerField(),
+                ),
+                Value(0), output_field=BigIntegerField(),
+            ),
+        )
+
+    @admin.display(description=_('balance'))
+    def current_balance_display(self, obj):
+        cents = getattr(obj, '_balance_annot', obj.current_cents)
+        return f'{Decimal(cents).scaleb(-2):,.2f} {obj.currency}'
+
+
+@admin.register(Journal)
+class JournalAdmin(admin.ModelAdmin):
+    list_display = ['code', 'name', 'type', 'is_active']
+    list_filter = ['type', 'is_active', 'company']
+    search_fields = ['code', 'name']
+
+
+class JournalEntryLineForm(forms.ModelForm):
+    """Edits amounts in dirhams while the model stores centimes."""
+
+    debit_amount = forms.DecimalField(
+        label=_('debit'), max_digits=15, decimal_places=2,
+        initial=Decimal('0.00'))
+    credit_amount = forms.DecimalField(
+        label=_('credit'), max_digits=15, decimal_places=2,
+        initial=Decimal('0.00'))
+
+    class Meta:
+        model = JournalEntryLine
+        fields = ['sequence', 'account', 'description', 'reference']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.fields['debit_amount'].initial = self.instance.debit_amount
+            self.fields['credit_amount'].initial = self.instance.credit_amount
+
+    def save(self, commit=True):
+        self.instance.debit_amount = self.cleaned_data['debit_amount']
+        self.instance.credit_amount = self.cleaned_data['credit_amount']
+        return super().save(commit=commit)
+
+
+class JournalEntryLineInline(admin.TabularInline):
+    model = JournalEntryLine
+    form = JournalEntryLineForm
+    extra = 0
+    fields = ['sequence', 'account', 'description', 'debit_amount',
+              'credit_amount', 'reference', 'reconciled']
+    readonly_fields = ['reconciled']
+
+    def get_queryset(self, request):
+        # The change page renders every line; without this each line costs
+        # a query for account, its type and the reconciling user.
+        return super().get_queryset(request).select_related(
+            'account', 'account__account_type', 'reconciled_by',
+        ).only(
+            'journal_entry_id', 'sequence', 'description', 'debit_cents',
+            'credit_cents', 'reference', 'reconciled',
+            'account__code', 'account__name', 'account__account_type__code',
+            'reconciled_by__username',
+        )
+
+
+@admin.register(JournalEntry)
+class JournalEntryAdmin(admin.ModelAdmin):
+    list_display = ['entry_number', 'date', 'journal', 'state', 'total_debit',
+                    'total_credit', 'is_balanced_display', 'posted_by']
+    list_filter = ['state', 'journal', 'date', 'company']
+    search_fields = ['entry_number', 'reference', 'description']
+    date_hierarchy = 'date'
+    inlines = [JournalEntryLineInline]
+    readonly_fields = ['entry_number', 'total_debit', 'total_credit',
+                       'posted_by', 'posted_at']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(
+            'journal', 'posted_by', 'created_by',
+        )
+
+    @admin.display(description=_('balanced'), boolean=True)
+    def is_balanced_display(self, obj):
+        # Posted entries have frozen totals; only drafts may lag behind
+        # their lines and need the full recomputation.
+        if obj.state != 'DRAFT':
+            return obj.total_debit_cents == obj.total_credit_cents
+        return obj.is_balanced()
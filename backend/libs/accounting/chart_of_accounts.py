@@ -0,0 +1,265 @@
+"""
+Setup of the Moroccan chart of accounts (Plan Comptable Général Marocain).
+
+``ChartOfAccountsService`` seeds a company with the PCGM classification
+(classes, rubriques, postes), a minimal set of postable accounts and the
+standard journals.
+"""
+import json
+from collections import namedtuple
+from functools import lru_cache, partial
+from itertools import groupby, takewhile
+from pathlib import Path
+
+from django.db import connection, transaction
+
+from .models import Account, AccountType, Journal
+
+# The PCGM classification ships as data, not source: rows of
+# (code, name, name_arabic, category, normal_balance, parent), parsed on
+# first use instead of at every worker import.
+_TEMPLATE_PATH = Path(__file__).resolve().parent / 'data' / 'pcgm_template.json'
+
+# The template rows the request path actually consumes: attribute access
+# on a tuple instead of dict hashing per field.
+AccountTypeSpec = namedtuple(
+    'AccountTypeSpec',
+    'code name name_arabic category normal_balance parent_code',
+)
+
+
+@lru_cache(maxsize=1)
+def _prepared_levels():
+    """Load the template and specialize it into per-depth spec lists.
+
+    In the PCGM numbering the code length is the tree depth (1 = classe,
+    2 = rubrique, 3 = poste), so sorting by code length is a topological
+    order and each group can be flushed as one batch. Runs once per
+    process, on first use.
+    """
+    with open(_TEMPLATE_PATH, encoding='utf-8') as fh:
+        template = json.load(fh)
+    ordered = sorted(template, key=lambda row: len(row[0]))
+    return [
+        [AccountTypeSpec._make(row) for row in level]
+        for _depth, level in groupby(ordered, key=lambda row: len(row[0]))
+    ]
+
+
+class ChartOfAccountsService:
+    """Creates the PCGM referential for a company."""
+
+    # Single source of truth for the standard journals; both creation
+    # paths read this list.
+    STANDARD_JOURNALS = [
+        {'code': 'VTE', 'name': 'Journal des ventes',
+         'name_arabic': 'يومية المبيعات', 'type': 'SALE',
+         'description': 'Factures et avoirs clients'},
+        {'code': 'ACH', 'name': 'Journal des achats',
+         'name_arabic': 'يومية المشتريات', 'type': 'PURCHASE',
+         'description': 'Factures et avoirs fournisseurs'},
+        {'code': 'BQ1', 'name': 'Journal de banque',
+         'name_arabic': 'يومية البنك', 'type': 'BANK',
+         'description': 'Mouvements bancaires'},
+        {'code': 'CSE', 'name': 'Journal de caisse',
+         'name_arabic': 'يومية الصندوق', 'type': 'CASH',
+         'description': 'Encaissements et décaissements en espèces'},
+        {'code': 'OD', 'name': 'Opérations diverses',
+         'name_arabic': 'عمليات مختلفة', 'type': 'GENERAL',
+         'description': 'Écritures diverses et de régularisation'},
+    ]
+
+    # Minimal postable accounts hung under the postes above.
+    BASIC_ACCOUNTS = [
+        {'code': '111100', 'name': 'Capital social', 'type_code': '111'},
+        {'code': '342100', 'name': 'Clients - ventes de biens et services',
+         'type_code': '342'},
+        {'code': '345500', 'name': 'État - TVA récupérable', 'type_code': '345'},
+        {'code': '441100', 'name': 'Fournisseurs', 'type_code': '441'},
+        {'code': '445500', 'name': 'État - TVA facturée', 'type_code': '445'},
+        {'code': '514100', 'name': 'Banque', 'type_code': '514'},
+        {'code': '516100', 'name': 'Caisse', 'type_code': '516'},
+        {'code': '611100', 'name': 'Achats de marchandises', 'type_code': '611'},
+        {'code': '613100', 'name': 'Locations et charges locatives',
+         'type_code': '613'},
+        {'code': '711100', 'name': 'Ventes de marchandises au Maroc',
+         'type_code': '711'},
+        {'code': '712100', 'name': 'Ventes de produits finis', 'type_code': '712'},
+    ]
+
+    @classmethod
+    def _plan(cls, company, user=None):
+        """Yield ``(model, batch)`` pairs in dependency order.
+
+        One data-driven walk of the templates: account-type levels come
+        out parents-first (classes, then rubriques, then postes), then
+        journals, then basic accounts, so a driver can flush each pair
+        with a single bulk INSERT. UUID primary keys are assigned
+        client-side, so children reference their parents without
+        re-querying.
+        """
+        # company/created_by are bound once instead of re-passed per row.
+        make_type = partial(AccountType, company=company, created_by=user)
+        account_types = {}
+        for level in _prepared_levels():
+            batch = [
+                make_type(
+                    code=spec.code,
+                    name=spec.name,
+                    name_arabic=spec.name_arabic,
+                    category=spec.category,
+                    normal_balance=spec.normal_balance,
+                    parent=account_types.get(spec.parent_code),
+                    level=len(spec.code) - 1,
+                )
+                for spec in level
+            ]
+            for account_type in batch:
+                # bulk_create skips save(), which normally maintains the
+                # materialized path; the parents are in memory with
+                # their paths already set, levels being planned in order.
+                parent = account_type.parent
+                account_type.tree_path = (
+                    (parent.tree_path if parent else [])
+                    + [account_type.pk]
+                )
+                account_types[account_type.code] = account_type
+            yield AccountType, batch
+
+        make_journal = partial(Journal, company=company, created_by=user)
+        yield Journal, [
+            make_journal(**journal_data) for journal_data in cls.STANDARD_JOURNALS
+        ]
+
+        make_account = partial(Account, company=company, created_by=user)
+        accounts = [
+            make_account(
+                code=account_data['code'],
+                name=account_data['name'],
+                account_type=account_types[account_data['type_code']],
+                normal_balance=(
+                    account_types[account_data['type_code']].normal_balance),
+            )
+            for account_data in cls.BASIC_ACCOUNTS
+            if account_data['type_code'] in account_types
+        ]
+        for account in accounts:
+            account.tree_path = [account.pk]  # basic accounts are roots
+        yield Account, accounts
+
+    @staticmethod
+    def _flush(plan):
+        """Drive a plan: one bulk INSERT per yielded batch.
+
+        bulk_create dispatches no per-row signals, so the usual receivers
+        (simple_history's post_save among them) never run — O(1) signal
+        work instead of one dispatch per row. The history snapshot is
+        therefore written explicitly, once per batch, restricted to the
+        rows the INSERT actually kept (reruns conflict away duplicates).
+        """
+        for model, batch in plan:
+            model.objects.bulk_create(batch, batch_size=500, ignore_conflicts=True)
+            inserted = model.objects.filter(pk__in=[obj.pk for obj in batch])
+            model.history.bulk_history_create(list(inserted))
+
+    @staticmethod
+    def _code_map(model, company):
+        """Authoritative ``{code: id}`` for the company, in one SELECT.
+
+        Thin by design: callers get keys, not ~100 hydrated instances
+        whose serialization would lazy-load FKs row by row. On reruns
+        this also reflects the pre-existing rows, not the discarded
+        in-memory ones.
+        """
+        return dict(
+            model.objects.filter(company=company).values_list('code', 'id')
+        )
+
+    @classmethod
+    def create_account_types(cls, company, user=None):
+        """Create the PCGM classification for ``company``.
+
+        Callers must hold the transaction: the entry points below open a
+        single atomic block, avoiding the SAVEPOINT a nested one costs.
+        """
+        account_type_levels = takewhile(
+            lambda pair: pair[0] is AccountType, cls._plan(company, user),
+        )
+        cls._flush(account_type_levels)
+        return {'account_types': cls._code_map(AccountType, company)}
+
+    @classmethod
+    def create_moroccan_chart_of_accounts(cls, company, user=None):
+        """Historical entry point: classification plus standard journals."""
+        with transaction.atomic():
+            result = cls.create_account_types(company, user)
+            result['journals'] = cls.create_standard_journals(company, user)
+            return result
+
+    @classmethod
+    def create_basic_accounts(cls, company, account_types, user=None):
+        """Create the minimal set of postable accounts under the postes.
+
+        ``account_types`` is a ``{code: id}`` map (see ``_code_map``);
+        FK resolution is a dict lookup and the insert is one statement
+        for the whole set.
+        """
+        make_account = partial(Account, company=company, created_by=user)
+        # bulk_create skips save(), which normally copies the type's
+        # normal balance onto the account.
+        normal_balances = dict(
+            AccountType.objects.filter(
+                id__in=account_types.values(),
+            ).values_list('id', 'normal_balance')
+        )
+        instances = [
+            make_account(
+                code=account_data['code'],
+                name=account_data['name'],
+                account_type_id=account_types[account_data['type_code']],
+                normal_balance=normal_balances[
+                    account_types[account_data['type_code']]],
+            )
+            for account_data in cls.BASIC_ACCOUNTS
+            if account_data['type_code'] in account_types
+        ]
+        for account in instances:
+            account.tree_path = [account.pk]  # basic accounts are roots
+        Account.objects.bulk_create(instances, batch_size=500, ignore_conflicts=True)
+        return cls._code_map(Account, company)
+
+    @classmethod
+    def create_standard_journals(cls, company, user=None):
+        """Create the standard posting journals in one INSERT."""
+        make_journal = partial(Journal, company=company, created_by=user)
+        instances = [
+            make_journal(**journal_data) for journal_data in cls.STANDARD_JOURNALS
+        ]
+        Journal.objects.bulk_create(instances, batch_size=500, ignore_conflicts=True)
+        return cls._code_map(Journal, company)
+
+    # Advisory-lock namespace for per-company setup; any project-unique
+    # int32 works, it only has to differ from other advisory users.
+    SETUP_LOCK_NS = 0x0C0A
+
+    @classmethod
+    def setup_chart_of_accounts(cls, company, user=None):
+        """Full setup: classification, basic accounts and journals.
+
+        Serialized per company with a transaction-scoped advisory lock:
+        a concurrent second caller blocks until the first commits, then
+        its inserts all hit ON CONFLICT DO NOTHING instead of doing the
+        full load twice and aborting one transaction at the end.
+        """
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT pg_advisory_xact_lock(%s, %s)',
+                    (cls.SETUP_LOCK_NS, company.id),
+                )
+            cls._flush(cls._plan(company, user))
+            return {
+                'account_types': cls._code_map(AccountType, company),
+                'accounts': cls._code_map(Account, company),
+                'journals': cls._code_map(Journal, company),
+            }
@@ -0,0 +1,521 @@
+"""
+Financial statements for Moroccan companies: trial balance (balance des
+comptes), balance sheet (bilan), income statement (CPC) and cash flow
+statement, built from posted journal entries.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import chain
+
+import numpy as np
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import BigIntegerField, Case, F, Max, Sum, When
+
+from .models import Account, AccountType, JournalEntry, JournalEntryLine
+from .utils import njit
+
+# Shared zero for defaults and accumulators; Decimal construction is not
+# free and these sit inside the per-account loops.
+_ZERO = Decimal('0.00')
+
+# CPC rubrique → accumulator slot; -1 marks lines outside the layout.
+_PNL_SLOTS = {'71': 0, '73': 1, '75': 2, '61': 3, '63': 4, '65': 5, '67': 6}
+
+
+@njit(cache=True)
+def _pnl_totals(slots, amounts):
+    """Accumulate the seven CPC subtotals in one compiled pass.
+
+    ``slots`` maps each line to its accumulator (see ``_PNL_SLOTS``),
+    ``amounts`` carries int64 centimes; pure integer work, so numba
+    compiles the loop to native code and without numba it still runs
+    as plain Python.
+    """
+    totals = np.zeros(7, dtype=np.int64)
+    for i in range(slots.shape[0]):
+        slot = slots[i]
+        if slot >= 0:
+            totals[slot] += amounts[i]
+    return totals
+
+
+def _cents(value):
+    """Exact int64 centimes of a two-decimal amount (``None`` → 0)."""
+    return 0 if value is None else int(value.scaleb(2))
+
+
+def _to_decimal(cents):
+    """Back to a two-decimal ``Decimal`` at the serialization boundary."""
+    return Decimal(cents).scaleb(-2)
+
+
+def _sum_amounts(items):
+    """Sum the ``amount`` of statement lines as one C-level reduction.
+
+    Object dtype keeps the values Decimal, so the totals stay exact; the
+    loop, frame and per-add dispatch of a generator ``sum()`` go away.
+    """
+    if not items:
+        return _ZERO
+    return np.fromiter((item.amount for item in items), dtype=object,
+                       count=len(items)).sum()
+
+
+@dataclass(frozen=True, slots=True)
+class FinancialStatementLine:
+    """One labelled amount of a statement section."""
+
+    code: str
+    name: str
+    amount: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodSnapshot:
+    """Pre-aggregated postings of one reporting period.
+
+    A "close the books" page renders the CPC and the cash flow
+    statement for the same period back to back; built once via
+    :meth:`FinancialStatementsService.period_snapshot`, this carries
+    the shared aggregates so the second statement re-queries nothing.
+    """
+
+    from_date: date
+    to_date: date
+    revenues: list
+    expenses: list
+    net_income: Decimal
+
+
+class FinancialStatementsService:
+    """Generates the statutory financial statements for a company."""
+
+    # Cached statements stay valid for an hour at most; the version key
+    # below invalidates them the moment an entry in scope changes.
+    CACHE_TTL = 3600
+
+    @classmethod
+    def _cached(cls, name, company, from_date, to_date, compute):
+        """Memoize a statement per (company, period, ledger version).
+
+        The version is the latest ``updated_at`` of the journal entries
+        in scope — one tiny indexed query. Any posting, edit or
+        cancellation moves it, so stale results are never served and no
+        explicit invalidation is needed; reopening an unchanged report
+        is a cache hit.
+        """
+        version = JournalEntry.objects.filter(
+            company=company, date__lte=to_date,
+        ).aggregate(v=Max('updated_at'))['v']
+        key = f'fs:{name}:{company.pk}:{from_date}:{to_date}:{version}'
+        return cache.get_or_set(key, compute, cls.CACHE_TTL)
+
+    @classmethod
+    def generate_balance_sheet(cls, company, as_of_date):
+        return cls._cached(
+            'balance_sheet', company, None, as_of_date,
+            lambda: cls._generate_balance_sheet(company, as_of_date))
+
+    @classmethod
+    def generate_income_statement(cls, company, from_date, to_date,
+                                  snapshot=None):
+        if snapshot is not None:
+            # The aggregates are already in memory; the cache round trip
+            # would only add serialization.
+            return cls._generate_income_statement(
+                company, from_date, to_date, snapshot)
+        return cls._cached(
+            'income_statement', company, from_date, to_date,
+            lambda: cls._generate_income_statement(
+                company, from_date, to_date))
+
+    @classmethod
+    def period_snapshot(cls, company, from_date, to_date):
+        """Aggregate one period once, for views rendering several
+        statements over it."""
+        return PeriodSnapshot(
+            from_date=from_date,
+            to_date=to_date,
+            revenues=cls._calculate_account_type_balances_for_period(
+                company, 'REVENUE', from_date, to_date),
+            expenses=cls._calculate_account_type_balances_for_period(
+                company, 'EXPENSE', from_date, to_date),
+            net_income=cls._compute_net_income(company, from_date, to_date),
+        )
+
+    @classmethod
+    def generate_trial_balance(cls, company, as_of_date):
+        """Trial balance of all postable accounts as of ``as_of_date``.
+
+        Movements are aggregated in a single GROUP BY over the posted
+        lines of the fiscal year, then joined to the accounts in one
+        Python pass. The sign dispatch on the normal balance happens
+        inside the aggregate with a conditional sum, so Postgres ships
+        back final signed movements and Python only adds the openings.
+
+        ``lines`` is a generator: the accounts stream from the cursor in
+        chunks and each line dict exists only while the renderer holds
+        it, so a 10 000-account chart never sits in memory at once. The
+        totals come from their own aggregate and are final before any
+        line is consumed. Streaming also means the result cannot go
+        through the pickling statement cache — only the materialized
+        statements do.
+        """
+        fiscal_year_start = date(as_of_date.year, 1, 1)
+        accounts = (
+            Account.objects.filter(
+                company=company, is_active=True, allow_posting=True,
+            )
+            .only('id', 'code', 'name', 'opening_cents')
+            .order_by('code')
+        )
+        movements = {
+            row['account_id']: (row['debit'], row['credit'], row['signed'])
+            for row in JournalEntryLine.objects.filter(
+                account__company=company,
+                journal_entry__state='POSTED',
+                journal_entry__date__range=[fiscal_year_start, as_of_date],
+            )
+            .values('account_id')
+            .annotate(
+                debit=Sum('debit_cents'),
+                credit=Sum('credit_cents'),
+                signed=Sum(Case(
+                    When(account__normal_balance='DEBIT',
+                         then=F('debit_cents') - F('credit_cents')),
+                    default=F('credit_cents') - F('debit_cents'),
+                    output_field=BigIntegerField(),
+                )),
+            )
+        }
+
+        totals = JournalEntryLine.objects.filter(
+            account__company=company,
+            account__is_active=True,
+            account__allow_posting=True,
+            journal_entry__state='POSTED',
+            journal_entry__date__range=[fiscal_year_start, as_of_date],
+        ).aggregate(d=Sum('debit_cents'), c=Sum('credit_cents'))
+
+        def iter_lines():
+            for account in accounts.iterator(chunk_size=2000):
+                debit, credit, signed = movements.get(account.id, (0, 0, 0))
+                yield {
+                    'code': account.code,
+                    'name': account.name,
+                    'opening_balance': _to_decimal(account.opening_cents),
+                    'debit': _to_decimal(debit),
+                    'credit': _to_decimal(credit),
+                    'closing_balance': _to_decimal(
+                        account.opening_cents + signed),
+                }
+
+        return {
+            'company': company,
+            'as_of_date': as_of_date,
+            'lines': iter_lines(),
+            'total_debit': _to_decimal(totals['d'] or 0),
+            'total_credit': _to_decimal(totals['c'] or 0),
+        }
+
+    @classmethod
+    def _calculate_account_type_balances(cls, company, category, as_of_date):
+        """One statement line per account type of ``category``.
+
+        One grouped aggregate over the posted lines plus one over the
+        opening balances — three queries per category instead of one per
+        account. Accounts hang off the postes, so the groups come back
+        keyed by poste code and are folded onto their rubrique (the
+        two-char prefix in the PCGM numbering) in Python. The sign
+        dispatch uses each rubrique's own ``normal_balance`` (accounts
+        inherit it from their type here). The folds accumulate the
+        integer centimes straight off the bigint columns — exact for
+        two-decimal amounts and far cheaper than per-add Decimal
+        objects — and convert on emission.
+        """
+        account_types = AccountType.objects.filter(
+            company=company, category=category, level=1, is_active=True,
+        ).order_by('code')
+        movements = {}
+        for row in (
+            JournalEntryLine.objects.filter(
+                account__company=company,
+                account__account_type__category=category,
+                journal_entry__state='POSTED',
+                journal_entry__date__lte=as_of_date,
+            )
+            .values('account__account_type__code')
+            .annotate(debit=Sum('debit_cents'), credit=Sum('credit_cents'))
+        ):
+            rubrique = row['account__account_type__code'][:2]
+            debit, credit = movements.get(rubrique, (0, 0))
+            movements[rubrique] = (
+                debit + row['debit'],
+                credit + row['credit'],
+            )
+        openings = {}
+        for row in (
+            Account.objects.filter(
+                company=company, account_type__category=category,
+                is_active=True,
+            )
+            .values('account_type__code')
+            .annotate(ob=Sum('opening_cents'))
+        ):
+            rubrique = row['account_type__code'][:2]
+            openings[rubrique] = openings.get(rubrique, 0) + row['ob']
+        lines = []
+        for account_type in account_types:
+            debit, credit = movements.get(account_type.code, (0, 0))
+            if account_type.normal_balance == 'DEBIT':
+                amount = debit - credit
+            else:
+                amount = credit - debit
+            amount += openings.get(account_type.code, 0)
+            lines.append(FinancialStatementLine(
+                code=account_type.code, name=account_type.name,
+                amount=_to_decimal(amount)))
+        return lines
+
+    @classmethod
+    def _calculate_account_type_balances_for_period(cls, company, category,
+                                                    from_date, to_date):
+        """Like :meth:`_calculate_account_type_balances`, over a period.
+
+        Period statements (CPC) only count movements between the two
+        dates, without the opening balances — one grouped aggregate, no
+        opening merge.
+        """
+        account_types = AccountType.objects.filter(
+            company=company, category=category, level=1, is_active=True,
+        ).order_by('code')
+        movements = {}
+        for row in (
+            JournalEntryLine.objects.filter(
+                account__company=company,
+                account__account_type__category=category,
+                journal_entry__state='POSTED',
+                journal_entry__date__range=[from_date, to_date],
+            )
+            .values('account__account_type__code')
+            .annotate(debit=Sum('debit_cents'), credit=Sum('credit_cents'))
+        ):
+            rubrique = row['account__account_type__code'][:2]
+            debit, credit = movements.get(rubrique, (0, 0))
+            movements[rubrique] = (
+                debit + row['debit'],
+                credit + row['credit'],
+            )
+        lines = []
+        for account_type in account_types:
+            debit, credit = movements.get(account_type.code, (0, 0))
+            if account_type.normal_balance == 'DEBIT':
+                amount = debit - credit
+            else:
+                amount = credit - debit
+            lines.append(FinancialStatementLine(
+                code=account_type.code, name=account_type.name,
+                amount=_to_decimal(amount)))
+        return lines
+
+    @classmethod
+    def _compute_net_income(cls, company, from_date, to_date):
+        """Net income of the period, as one grouped aggregate.
+
+        A single aggregate grouped by category covers both the revenue
+        and the expense side — one query for the scalar instead of one
+        per P&L account.
+        """
+        revenues = 0
+        expenses = 0
+        for row in (
+            JournalEntryLine.objects.filter(
+                account__company=company,
+                account__account_type__category__in=['REVENUE', 'EXPENSE'],
+                journal_entry__state='POSTED',
+                journal_entry__date__range=[from_date, to_date],
+            )
+            .values('account__account_type__category')
+            .annotate(debit=Sum('debit_cents'), credit=Sum('credit_cents'))
+        ):
+            if row['account__account_type__category'] == 'REVENUE':
+                revenues = row['credit'] - row['debit']
+            else:
+                expenses = row['debit'] - row['credit']
+        return _to_decimal(revenues - expenses)
+
+    @classmethod
+    def _calculate_current_year_result(cls, company, as_of_date):
+        """Net result of the fiscal year to date (résultat de l'exercice)."""
+        fiscal_year_start = date(as_of_date.year, 1, 1)
+        return cls._compute_net_income(company, fiscal_year_start, as_of_date)
+
+    @classmethod
+    def _balances_closing_connection(cls, company, category, as_of_date):
+        """Worker for the concurrent balance-sheet batches.
+
+        Django connections are thread-local; closing the worker's own
+        at the end keeps the short-lived pool threads from leaking one
+        each.
+        """
+        try:
+            return cls._calculate_account_type_balances(
+                company, category, as_of_date)
+        finally:
+            connection.close()
+
+    @classmethod
+    def _generate_balance_sheet(cls, company, as_of_date):
+        """Balance sheet (bilan) as of ``as_of_date``.
+
+        The three category batches are independent, so they run on a
+        small thread pool and the wall clock is the slowest of the
+        three instead of their sum.
+        """
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(cls._balances_closing_connection,
+                            company, category, as_of_date)
+                for category in ('ASSET', 'LIABILITY', 'EQUITY')
+            ]
+            assets, liabilities, equity = [
+                future.result() for future in futures]
+        current_year_result = cls._calculate_current_year_result(
+            company, as_of_date)
+
+        total_assets = _sum_amounts(assets)
+        total_liabilities = _sum_amounts(liabilities)
+        total_equity = _sum_amounts(equity) + current_year_result
+        return {
+            'company': company,
+            'as_of_date': as_of_date,
+            'assets': assets,
+            'liabilities': liabilities,
+            'equity': equity,
+            'current_year_result': current_year_result,
+            'total_assets': total_assets,
+            'total_liabilities': total_liabilities,
+            'total_equity': total_equity,
+            'is_balanced': total_assets == total_liabilities + total_equity,
+        }
+
+    @classmethod
+    def _generate_income_statement(cls, company, from_date, to_date,
+                                   snapshot=None):
+        """Income statement (CPC) for the period.
+
+        Sections follow the CPC layout: exploitation (71/61), financier
+        (73/63), non courant (75/65) and impôts sur les résultats (67).
+        """
+        if snapshot is not None:
+            revenues = snapshot.revenues
+            expenses = snapshot.expenses
+        else:
+            revenues = cls._calculate_account_type_balances_for_period(
+                company, 'REVENUE', from_date, to_date)
+            expenses = cls._calculate_account_type_balances_for_period(
+                company, 'EXPENSE', from_date, to_date)
+
+        # Bucket membership stays a Python pass — the sections carry the
+        # line objects — but the seven subtotals run as one compiled
+        # reduction over slot/amount arrays.
+        items = list(chain(revenues, expenses))
+        slots = np.fromiter(
+            (_PNL_SLOTS.get(item.code[:2], -1) for item in items),
+            dtype=np.int64, count=len(items))
+        amounts = np.fromiter(
+            (_cents(item.amount) for item in items),
+            dtype=np.int64, count=len(items))
+        totals = _pnl_totals(slots, amounts)
+
+        buckets = {'71': [], '73': [], '75': [],
+                   '61': [], '63': [], '65': [], '67': []}
+        for item in items:
+            bucket = buckets.get(item.code[:2])
+            if bucket is not None:
+                bucket.append(item)
+
+        operating_revenues = buckets['71']
+        financial_revenues = buckets['73']
+        non_current_revenues = buckets['75']
+        operating_expenses = buckets['61']
+        financial_expenses = buckets['63']
+        non_current_expenses = buckets['65']
+        income_tax = buckets['67']
+
+        operating_result = _to_decimal(int(totals[0] - totals[3]))
+        financial_result = _to_decimal(int(totals[1] - totals[4]))
+        non_current_result = _to_decimal(int(totals[2] - totals[5]))
+        total_income_tax = _to_decimal(int(totals[6]))
+        if snapshot is not None:
+            net_income = snapshot.net_income
+        else:
+            net_income = cls._compute_net_income(company, from_date, to_date)
+        return {
+            'company': company,
+            'from_date': from_date,
+            'to_date': to_date,
+            'operating_revenues': operating_revenues,
+            'operating_expenses': operating_expenses,
+            'operating_result': operating_result,
+            'financial_revenues': financial_revenues,
+            'financial_expenses': financial_expenses,
+            'financial_result': financial_result,
+            'non_current_revenues': non_current_revenues,
+            'non_current_expenses': non_current_expenses,
+            'non_current_result': non_current_result,
+            'income_tax': total_income_tax,
+            'net_income': net_income,
+        }
+
+    @staticmethod
+    def _sum_balances_as_of(company, code_prefix, dt):
+        """Posted movements of the ``code_prefix`` accounts up to ``dt``,
+        in centimes.
+
+        One aggregate returning a scalar; treasury (classe 5) accounts
+        are DEBIT-normal, so the balance is debit minus credit.
+        """
+        totals = JournalEntryLine.objects.filter(
+            account__company=company,
+            account__code__startswith=code_prefix,
+            journal_entry__state='POSTED',
+            journal_entry__date__lte=dt,
+        ).aggregate(d=Sum('debit_cents'), c=Sum('credit_cents'))
+        return (totals['d'] or 0) - (totals['c'] or 0)
+
+    @classmethod
+    def generate_cash_flow_statement(cls, company, from_date, to_date,
+                                     snapshot=None):
+        """Cash flow statement over the period, from the treasury accounts.
+
+        Opening and closing cash are two aggregate queries (plus one for
+        the opening balances, shared by both points in time) instead of
+        one per treasury account per date.
+        """
+        opening_cents = Account.objects.filter(
+            company=company, code__startswith='5', is_active=True,
+            allow_posting=True,
+        ).aggregate(ob=Sum('opening_cents'))['ob'] or 0
+        opening_cash = _to_decimal(opening_cents + cls._sum_balances_as_of(
+            company, '5', from_date - timedelta(days=1)))
+        closing_cash = _to_decimal(opening_cents + cls._sum_balances_as_of(
+            company, '5', to_date))
+        # Only net_income is consumed here; generating the full CPC for
+        # it would redo every section aggregate just to throw them away.
+        if snapshot is not None:
+            net_income = snapshot.net_income
+        else:
+            net_income = cls._compute_net_income(company, from_date, to_date)
+        return {
+            'company': company,
+            'from_date': from_date,
+            'to_date': to_date,
+            'opening_cash': opening_cash,
+            'closing_cash': closing_cash,
+            'net_change': closing_cash - opening_cash,
+            'net_income': net_income,
+        }
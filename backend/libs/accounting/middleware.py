@@ -0,0 +1,31 @@
+"""
+Request-scoped accounting context.
+
+``AccountingMiddleware`` exposes the active company on the request for
+the accounting views and reports, resolved from the session.
+"""
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
+
+from libs.core.models import Company
+
+
+def _get_active_company(request):
+    company_id = request.session.get('active_company_id')
+    if company_id is None:
+        return None
+    return Company.objects.filter(pk=company_id, is_active=True).first()
+
+
+class AccountingMiddleware(MiddlewareMixin):
+    """Attaches ``request.company`` for the accounting layer.
+
+    Resolution is lazy: the query only runs when a view actually reads
+    ``request.company``, so static files and health probes pay one
+    attribute set and nothing else.
+    """
+
+    def process_request(self, request):
+        request.company = SimpleLazyObject(
+            lambda: _get_active_company(request))
+        return None
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0001_initial'),
+        ('core', '0002_documentsequence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='journalentry',
+            index=models.Index(fields=['state', 'date'], name='je_state_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalentryline',
+            index=models.Index(fields=['account', 'journal_entry'], include=('debit_amount', 'credit_amount'), name='jel_acct_je_cover'),
+        ),
+    ]
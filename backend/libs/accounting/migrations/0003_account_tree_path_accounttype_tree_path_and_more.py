@@ -0,0 +1,46 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:31
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0002_journalentry_je_state_date_idx_and_more'),
+        ('core', '0002_documentsequence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='tree_path',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='accounttype',
+            name='tree_path',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='historicalaccount',
+            name='tree_path',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='historicalaccounttype',
+            name='tree_path',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tree_path'], name='account_tree_path_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='accounttype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tree_path'], name='accounttype_tree_path_gin'),
+        ),
+    ]
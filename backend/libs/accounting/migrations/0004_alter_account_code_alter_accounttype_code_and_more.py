@@ -0,0 +1,35 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:33
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0003_account_tree_path_accounttype_tree_path_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='code',
+            field=models.CharField(max_length=20, validators=[django.core.validators.RegexValidator(message='Code must contain only digits', regex=re.compile('^[0-9]+\\Z'))], verbose_name='code'),
+        ),
+        migrations.AlterField(
+            model_name='accounttype',
+            name='code',
+            field=models.CharField(max_length=10, validators=[django.core.validators.RegexValidator(message='Code must contain only digits, capitals, - or .', regex=re.compile('^[0-9A-Z\\-.]+\\Z'))], verbose_name='code'),
+        ),
+        migrations.AlterField(
+            model_name='historicalaccount',
+            name='code',
+            field=models.CharField(max_length=20, validators=[django.core.validators.RegexValidator(message='Code must contain only digits', regex=re.compile('^[0-9]+\\Z'))], verbose_name='code'),
+        ),
+        migrations.AlterField(
+            model_name='historicalaccounttype',
+            name='code',
+            field=models.CharField(max_length=10, validators=[django.core.validators.RegexValidator(message='Code must contain only digits, capitals, - or .', regex=re.compile('^[0-9A-Z\\-.]+\\Z'))], verbose_name='code'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0004_alter_account_code_alter_accounttype_code_and_more'),
+        ('core', '0002_documentsequence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(condition=models.Q(('allow_posting', True), ('is_active', True)), fields=['company', 'code'], name='acct_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalentry',
+            index=models.Index(condition=models.Q(('state', 'POSTED')), fields=['company', 'date'], name='je_posted_idx'),
+        ),
+    ]
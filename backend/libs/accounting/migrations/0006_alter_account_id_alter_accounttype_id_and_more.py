@@ -0,0 +1,64 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:35
+
+import libs.accounting.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0005_account_acct_active_idx_journalentry_je_posted_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='id',
+            field=models.UUIDField(default=libs.accounting.models._uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='accounttype',
+            name='id',
+            field=models.UUIDField(default=libs.accounting.models._uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='historicalaccount',
+            name='id',
+            field=models.UUIDField(db_index=True, default=libs.accounting.models._uuid7, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='historicalaccounttype',
+            name='id',
+            field=models.UUIDField(db_index=True, default=libs.accounting.models._uuid7, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='historicaljournal',
+            name='id',
+            field=models.UUIDField(db_index=True, default=libs.accounting.models._uuid7, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='historicaljournalentry',
+            name='id',
+            field=models.UUIDField(db_index=True, default=libs.accounting.models._uuid7, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='historicaljournalentryline',
+            name='id',
+            field=models.UUIDField(db_index=True, default=libs.accounting.models._uuid7, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='journal',
+            name='id',
+            field=models.UUIDField(default=libs.accounting.models._uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='journalentry',
+            name='id',
+            field=models.UUIDField(default=libs.accounting.models._uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='journalentryline',
+            name='id',
+            field=models.UUIDField(default=libs.accounting.models._uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
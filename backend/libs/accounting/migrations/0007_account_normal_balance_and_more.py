@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0006_alter_account_id_alter_accounttype_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='normal_balance',
+            field=models.CharField(blank=True, choices=[('DEBIT', 'Debit'), ('CREDIT', 'Credit')], editable=False, max_length=6, verbose_name='normal balance'),
+        ),
+        migrations.AddField(
+            model_name='historicalaccount',
+            name='normal_balance',
+            field=models.CharField(blank=True, choices=[('DEBIT', 'Debit'), ('CREDIT', 'Credit')], editable=False, max_length=6, verbose_name='normal balance'),
+        ),
+    ]
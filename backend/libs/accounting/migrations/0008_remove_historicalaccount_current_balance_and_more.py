@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0007_account_normal_balance_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='historicalaccount',
+            name='current_balance',
+        ),
+        migrations.RemoveField(
+            model_name='historicalaccount',
+            name='tree_path',
+        ),
+        migrations.RemoveField(
+            model_name='historicalaccounttype',
+            name='tree_path',
+        ),
+    ]
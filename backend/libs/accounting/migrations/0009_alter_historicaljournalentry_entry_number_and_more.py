@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0008_remove_historicalaccount_current_balance_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='historicaljournalentry',
+            name='entry_number',
+            field=models.CharField(max_length=50, verbose_name='entry number'),
+        ),
+        migrations.AlterField(
+            model_name='journalentry',
+            name='entry_number',
+            field=models.CharField(max_length=50, verbose_name='entry number'),
+        ),
+    ]
@@ -0,0 +1,146 @@
+# Generated by Django 5.2.17 on 2026-08-28 15:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0009_alter_historicaljournalentry_entry_number_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='journalentryline',
+            name='jel_acct_je_cover',
+        ),
+        migrations.AddField(
+            model_name='account',
+            name='current_cents',
+            field=models.BigIntegerField(default=0, verbose_name='current balance (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='account',
+            name='opening_cents',
+            field=models.BigIntegerField(default=0, verbose_name='opening balance (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='historicalaccount',
+            name='opening_cents',
+            field=models.BigIntegerField(default=0, verbose_name='opening balance (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='historicaljournalentry',
+            name='total_credit_cents',
+            field=models.BigIntegerField(default=0, verbose_name='total credit (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='historicaljournalentry',
+            name='total_debit_cents',
+            field=models.BigIntegerField(default=0, verbose_name='total debit (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='historicaljournalentryline',
+            name='credit_cents',
+            field=models.BigIntegerField(default=0, verbose_name='credit (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='historicaljournalentryline',
+            name='debit_cents',
+            field=models.BigIntegerField(default=0, verbose_name='debit (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='journalentry',
+            name='total_credit_cents',
+            field=models.BigIntegerField(default=0, verbose_name='total credit (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='journalentry',
+            name='total_debit_cents',
+            field=models.BigIntegerField(default=0, verbose_name='total debit (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='journalentryline',
+            name='credit_cents',
+            field=models.BigIntegerField(default=0, verbose_name='credit (centimes)'),
+        ),
+        migrations.AddField(
+            model_name='journalentryline',
+            name='debit_cents',
+            field=models.BigIntegerField(default=0, verbose_name='debit (centimes)'),
+        ),
+        # Populate the centime columns from the NUMERIC ones before the
+        # latter are dropped; the historical tables carry the same data.
+        migrations.RunSQL(
+            sql=[
+                'UPDATE accounting_account SET'
+                ' opening_cents = ROUND(opening_balance * 100)::bigint,'
+                ' current_cents = ROUND(current_balance * 100)::bigint',
+                'UPDATE accounting_historicalaccount SET'
+                ' opening_cents = ROUND(opening_balance * 100)::bigint',
+                'UPDATE accounting_journalentry SET'
+                ' total_debit_cents = ROUND(total_debit * 100)::bigint,'
+                ' total_credit_cents = ROUND(total_credit * 100)::bigint',
+                'UPDATE accounting_historicaljournalentry SET'
+                ' total_debit_cents = ROUND(total_debit * 100)::bigint,'
+                ' total_credit_cents = ROUND(total_credit * 100)::bigint',
+                'UPDATE accounting_journalentryline SET'
+                ' debit_cents = ROUND(debit_amount * 100)::bigint,'
+                ' credit_cents = ROUND(credit_amount * 100)::bigint',
+                'UPDATE accounting_historicaljournalentryline SET'
+                ' debit_cents = ROUND(debit_amount * 100)::bigint,'
+                ' credit_cents = ROUND(credit_amount * 100)::bigint',
+            ],
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RemoveField(
+            model_name='account',
+            name='current_balance',
+        ),
+        migrations.RemoveField(
+            model_name='account',
+            name='opening_balance',
+        ),
+        migrations.RemoveField(
+            model_name='historicalaccount',
+            name='opening_balance',
+        ),
+        migrations.RemoveField(
+            model_name='historicaljournalentry',
+            name='total_credit',
+        ),
+        migrations.RemoveField(
+            model_name='historicaljournalentry',
+            name='total_debit',
+        ),
+        migrations.RemoveField(
+            model_name='historicaljournalentryline',
+            name='credit_amount',
+        ),
+        migrations.RemoveField(
+            model_name='historicaljournalentryline',
+            name='debit_amount',
+        ),
+        migrations.RemoveField(
+            model_name='journalentry',
+            name='total_credit',
+        ),
+        migrations.RemoveField(
+            model_name='journalentry',
+            name='total_debit',
+        ),
+        migrations.RemoveField(
+            model_name='journalentryline',
+            name='credit_amount',
+        ),
+        migrations.RemoveField(
+            model_name='journalentryline',
+            name='debit_amount',
+        ),
+        migrations.AddIndex(
+            model_name='journalentryline',
+            index=models.Index(fields=['account', 'journal_entry'], include=('debit_cents', 'credit_cents'), name='jel_acct_je_cover'),
+        ),
+    ]
@@ -0,0 +1,740 @@
+"""
+General ledger models following the Plan Comptable Général Marocain (PCGM):
+account types (classes), accounts, journals and journal entries.
+"""
+import os
+import re
+import time
+import uuid
+from decimal import ROUND_HALF_UP, Decimal
+from functools import cached_property
+
+import numpy as np
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.validators import RegexValidator
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from simple_history.models import HistoricalRecords
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+
+from libs.core.models import Company, DocumentSequence
+
+from .utils import njit
+
+# Compiled once at import: bulk imports validate these per row, and \Z
+# (unlike $) refuses a trailing newline outright.
+_CODE_DIGITS_RE = re.compile(r'^[0-9]+\Z')
+_CODE_CLASSIF_RE = re.compile(r'^[0-9A-Z\-.]+\Z')
+
+
+@njit(cache=True)
+def _sum_by_account(inverse, net_cents, n_accounts):
+    """Scatter-add the per-line nets onto their dense account slot.
+
+    ``inverse`` maps each line to 0..n_accounts-1 (see ``np.unique``),
+    ``net_cents`` carries int64 centimes; pure integer work, so numba
+    compiles the loop to native code and the sums stay exact where
+    float64 weights would round past 2^53. Serial on purpose: a
+    parallel scatter-add races on the output slots. Without numba it
+    still runs as plain Python.
+    """
+    totals = np.zeros(n_accounts, dtype=np.int64)
+    for i in range(inverse.shape[0]):
+        totals[inverse[i]] += net_cents[i]
+    return totals
+
+
+def _cents(value):
+    """Integer centimes of an amount, rounded half-up at the centime.
+
+    int() would truncate, and float inputs carry binary noise below the
+    centime (Decimal(12.1).scaleb(2) is 1209.99…), so the conversion
+    rounds explicitly — these setters are the edge of the centime
+    representation.
+    """
+    return int(Decimal(value).scaleb(2).to_integral_value(ROUND_HALF_UP))
+
+
+def _amount(cents):
+    """Two-decimal ``Decimal`` of an integer centimes column."""
+    return Decimal(cents).scaleb(-2)
+
+
+def _uuid7():
+    """Time-ordered UUID (RFC 9562 version 7 layout).
+
+    uuid4 scatters inserts across the whole pk B-tree; with a leading
+    millisecond timestamp, new rows land on the rightmost pages like a
+    serial would, keeping the hot part of the index (and of every FK
+    index on JournalEntryLine) cache-resident and cutting WAL churn.
+    Everything that relies on client-side UUID assignment keeps working.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62 & 0xFFF) << 64
+        | 0x2 << 62
+        | (rand & (1 << 62) - 1)
+    )
+    return uuid.UUID(int=value)
+
+
+class AccountType(models.Model):
+    """A node of the PCGM classification (classe, rubrique, poste)."""
+
+    CATEGORIES = [
+        ('ASSET', _('Asset')),
+        ('LIABILITY', _('Liability')),
+        ('EQUITY', _('Equity')),
+        ('REVENUE', _('Revenue')),
+        ('EXPENSE', _('Expense')),
+    ]
+
+    NORMAL_BALANCES = [
+        ('DEBIT', _('Debit')),
+        ('CREDIT', _('Credit')),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=_uuid7, editable=False)
+    company = models.ForeignKey(Company, on_delete=models.CASCADE,
+                                related_name='account_types')
+    code = models.CharField(
+        _('code'), max_length=10,
+        validators=[RegexValidator(
+            regex=_CODE_CLASSIF_RE,
+            message=_('Code must contain only digits, capitals, - or .'))],
+    )
+    name = models.CharField(_('name'), max_length=255)
+    name_arabic = models.CharField(_('name (arabic)'), max_length=255, blank=True)
+    category = models.CharField(_('category'), max_length=10, choices=CATEGORIES)
+    normal_balance = models.CharField(_('normal balance'), max_length=6,
+                                      choices=NORMAL_BALANCES)
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True,
+                               blank=True, related_name='children')
+    # Materialized path (root first, self last): subtree queries become
+    # one GIN-indexed array containment test instead of a tree walk.
+    tree_path = ArrayField(models.UUIDField(), default=list, editable=False)
+    level = models.PositiveSmallIntegerField(_('level'), default=0)
+    is_active = models.BooleanField(_('active'), default=True)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT,
+                                   null=True, blank=True, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # tree_path is derived from parent and rebuilt on save; snapshotting
+    # it would only fatten every history row.
+    history = HistoricalRecords(excluded_fields=['tree_path'])
+
+    class Meta:
+        verbose_name = _('account type')
+        verbose_name_plural = _('account types')
+        unique_together = [['company', 'code']]
+        ordering = ['code']
+        indexes = [
+            GinIndex(fields=['tree_path'], name='accounttype_tree_path_gin'),
+        ]
+
+    def __str__(self):
+        return f'{self.code} - {self.name}'
+
+    def save(self, *args, **kwargs):
+        # The UUID pk exists before the INSERT, so the path can be set
+        # on creates too. Reparenting a node with children needs a
+        # subtree rebuild, which the chart never does in practice.
+        parent_path = self.parent.tree_path if self.parent_id else []
+        self.tree_path = parent_path + [self.pk]
+        super().save(*args, **kwargs)
+
+    def _path_nodes(self):
+        """Nodes from the root down to self.
+
+        The materialized path makes this one ``in_bulk`` fetch; the
+        recursive parent walk it replaces fired one SELECT per level.
+        Unsaved rows have no path yet and fall back to walking parents.
+        """
+        if not self.tree_path:
+            nodes = []
+            node = self
+            while node is not None:
+                nodes.append(node)
+                node = node.parent
+            return list(reversed(nodes))
+        nodes = type(self).objects.in_bulk(self.tree_path)
+        nodes[self.pk] = self
+        return [nodes[pk] for pk in self.tree_path]
+
+    @property
+    def full_code(self):
+        return '.'.join(node.code for node in self._path_nodes())
+
+    @property
+    def full_name(self):
+        return ' / '.join(node.name for node in self._path_nodes())
+
+    @classmethod
+    def get_descendants_of(cls, root_id):
+        """Account types below ``root_id``: one indexed containment test."""
+        return cls.objects.filter(
+            tree_path__contains=[root_id]).exclude(pk=root_id)
+
+    def get_descendants(self):
+        """All account types below this node."""
+        return list(type(self).get_descendants_of(self.pk))
+
+
+class Account(models.Model):
+    """A ledger account (compte) under an :class:`AccountType`."""
+
+    id = models.UUIDField(primary_key=True, default=_uuid7, editable=False)
+    company = models.ForeignKey(Company, on_delete=models.CASCADE,
+                                related_name='accounts')
+    code = models.CharField(
+        _('code'), max_length=20,
+        validators=[RegexValidator(
+            regex=_CODE_DIGITS_RE,
+            message=_('Code must contain only digits'))],
+    )
+    name = models.CharField(_('name'), max_length=255)
+    name_arabic = models.CharField(_('name (arabic)'), max_length=255, blank=True)
+    account_type = models.ForeignKey(AccountType, on_delete=models.PROTECT,
+                                     related_name='accounts')
+    # Denormalized from account_type, synced in save() (and by the
+    # AccountType signal on the rare rate-of-change): every balance
+    # query dispatches on it, and the local column saves that JOIN.
+    normal_balance = models.CharField(
+        _('normal balance'), max_length=6,
+        choices=AccountType.NORMAL_BALANCES, editable=False, blank=True)
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True,
+                               blank=True, related_name='children')
+    # Materialized path, same scheme as AccountType.tree_path.
+    tree_path = ArrayField(models.UUIDField(), default=list, editable=False)
+    currency = models.CharField(_('currency'), max_length=3, default='MAD')
+    # Balances are stored as integer centimes (see JournalEntryLine for
+    # the rationale); the *_balance properties keep the Decimal API.
+    opening_cents = models.BigIntegerField(_('opening balance (centimes)'),
+                                           default=0)
+    current_cents = models.BigIntegerField(_('current balance (centimes)'),
+                                           default=0)
+    allow_posting = models.BooleanField(_('allow posting'), default=True)
+    is_active = models.BooleanField(_('active'), default=True)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT,
+                                   null=True, blank=True, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Derived columns stay out of the audit trail: tree_path follows
+    # parent, and current_balance is maintained by posting/rebuild
+    # through update()/bulk_update() precisely so that system-generated
+    # balance writes never pay a history INSERT per account. Excluding
+    # it also keeps user edits (renames etc.) from snapshotting a
+    # balance that was stale the moment the next entry posted.
+    history = HistoricalRecords(excluded_fields=['current_cents',
+                                                 'tree_path'])
+
+    class Meta:
+        verbose_name = _('account')
+        verbose_name_plural = _('accounts')
+        unique_together = [['company', 'code']]
+        ordering = ['code']
+        indexes = [
+            models.Index(fields=['company', 'is_active']),
+            GinIndex(fields=['tree_path'], name='account_tree_path_gin'),
+            # Reporting always filters active + postable; the partial
+            # index only carries those rows, so it stays small enough
+            # to live in shared_buffers on big historical charts.
+            models.Index(fields=['company', 'code'], name='acct_active_idx',
+                         condition=models.Q(is_active=True,
+                                            allow_posting=True)),
+        ]
+
+    def __str__(self):
+        return f'{self.code} - {self.name}'
+
+    def save(self, *args, **kwargs):
+        parent_path = self.parent.tree_path if self.parent_id else []
+        self.tree_path = parent_path + [self.pk]
+        if self.account_type_id:
+            self.normal_balance = self.account_type.normal_balance
+        super().save(*args, **kwargs)
+
+    @property
+    def opening_balance(self):
+        return _amount(self.opening_cents)
+
+    @opening_balance.setter
+    def opening_balance(self, value):
+        self.opening_cents = _cents(value)
+
+    @property
+    def current_balance(self):
+        return _amount(self.current_cents)
+
+    @current_balance.setter
+    def current_balance(self, value):
+        self.current_cents = _cents(value)
+
+    @cached_property
+    def category(self):
+        # Unlike normal_balance, category is not denormalized; without
+        # select_related this is one query, so cache it per instance
+        # rather than re-touching the relation on every access.
+        return self.account_type.category
+
+    @property
+    def is_debit_account(self):
+        return self.normal_balance == 'DEBIT'
+
+    @property
+    def is_credit_account(self):
+        return self.normal_balance == 'CREDIT'
+
+    def _path_nodes(self):
+        """Nodes from the root down to self; see AccountType._path_nodes."""
+        if not self.tree_path:
+            nodes = []
+            node = self
+            while node is not None:
+                nodes.append(node)
+                node = node.parent
+            return list(reversed(nodes))
+        nodes = type(self).objects.in_bulk(self.tree_path)
+        nodes[self.pk] = self
+        return [nodes[pk] for pk in self.tree_path]
+
+    @property
+    def full_code(self):
+        return '.'.join(node.code for node in self._path_nodes())
+
+    @classmethod
+    def get_descendants_of(cls, root_id):
+        """Accounts below ``root_id``: one indexed containment test."""
+        return cls.objects.filter(
+            tree_path__contains=[root_id]).exclude(pk=root_id)
+
+    def get_descendants(self):
+        """All accounts below this one."""
+        return list(type(self).get_descendants_of(self.pk))
+
+    @classmethod
+    def rebuild_balances(cls, company):
+        """Recompute every ``current_balance`` from the posted lines.
+
+        Maintenance entry point for after imports or repairs: one
+        projected scan of the lines — already integer centimes on disk,
+        so no Decimal ever materializes — a dense-indexed group-by
+        through the compiled ``_sum_by_account`` kernel and one bulk
+        UPDATE. The accumulation is exact int64 end to end. Returns
+        the number of accounts written.
+        """
+        rows = JournalEntryLine.objects.filter(
+            journal_entry__company=company, journal_entry__state='POSTED',
+        ).values_list('account_id', 'debit_cents', 'credit_cents')
+        account_ids = []
+        net_cents = []
+        for account_id, debit, credit in rows.iterator(chunk_size=10000):
+            account_ids.append(account_id)
+            net_cents.append(debit - credit)
+        totals = {}
+        if account_ids:
+            unique_ids, inverse = np.unique(
+                np.array(account_ids, dtype=object), return_inverse=True)
+            sums = _sum_by_account(
+                inverse.astype(np.int64),
+                np.array(net_cents, dtype=np.int64),
+                len(unique_ids))
+            totals = {
+                account_id: int(total)
+                for account_id, total in zip(unique_ids, sums)
+            }
+        accounts = list(
+            cls.objects.filter(company=company)
+            .only('id', 'current_cents', 'normal_balance')
+        )
+        for account in accounts:
+            net = totals.get(account.pk, 0)
+            if account.normal_balance == 'CREDIT':
+                net = -net
+            account.current_cents = net
+        cls.objects.bulk_update(accounts, ['current_cents'],
+                                batch_size=1000)
+        return len(accounts)
+
+    def get_balance(self, as_of_date=None):
+        """Balance of posted entries up to ``as_of_date`` (inclusive).
+
+        One aggregate returning two scalars; the line rows never leave
+        Postgres, the covering (account, journal_entry) index lets the
+        SUMs run as an index-only scan, and SUM(bigint) skips NUMERIC
+        arithmetic entirely.
+        """
+        lines = JournalEntryLine.objects.filter(
+            account=self, journal_entry__state='POSTED',
+        )
+        if as_of_date is not None:
+            lines = lines.filter(journal_entry__date__lte=as_of_date)
+        totals = lines.aggregate(d=models.Sum('debit_cents'),
+                                 c=models.Sum('credit_cents'))
+        total_debit = totals['d'] or 0
+        total_credit = totals['c'] or 0
+        if self.normal_balance == 'DEBIT':
+            return _amount(self.opening_cents + total_debit - total_credit)
+        return _amount(self.opening_cents + total_credit - total_debit)
+
+    @classmethod
+    def get_balances(cls, account_ids, as_of_date=None):
+        """Balances of many accounts at once, as ``{account_id: balance}``.
+
+        Dashboards and statement footers want dozens of balances in one
+        go; looping over :meth:`get_balance` costs one SUM query per
+        account. This is one GROUP BY over the posted lines plus one
+        narrow fetch of the accounts, whatever the size of the batch.
+        """
+        lines = JournalEntryLine.objects.filter(
+            account_id__in=account_ids, journal_entry__state='POSTED',
+        )
+        if as_of_date is not None:
+            lines = lines.filter(journal_entry__date__lte=as_of_date)
+        moved = {
+            row['account_id']: (row['d'], row['c'])
+            for row in lines.values('account_id').annotate(
+                d=models.Sum('debit_cents'),
+                c=models.Sum('credit_cents'))
+        }
+        balances = {}
+        rows = cls.objects.filter(pk__in=account_ids).values_list(
+            'id', 'opening_cents', 'normal_balance')
+        for account_id, opening, normal_balance in rows:
+            debit, credit = moved.get(account_id, (0, 0))
+            if normal_balance == 'DEBIT':
+                balances[account_id] = _amount(opening + debit - credit)
+            else:
+                balances[account_id] = _amount(opening + credit - debit)
+        return balances
+
+
+class Journal(models.Model):
+    """A posting journal (journal des ventes, achats, banque...)."""
+
+    TYPES = [
+        ('SALE', _('Sales')),
+        ('PURCHASE', _('Purchases')),
+        ('BANK', _('Bank')),
+        ('CASH', _('Cash')),
+        ('GENERAL', _('General / OD')),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=_uuid7, editable=False)
+    company = models.ForeignKey(Company, on_delete=models.CASCADE,
+                                related_name='journals')
+    code = models.CharField(_('code'), max_length=10)
+    name = models.CharField(_('name'), max_length=100)
+    name_arabic = models.CharField(_('name (arabic)'), max_length=100, blank=True)
+    type = models.CharField(_('type'), max_length=10, choices=TYPES)
+    description = models.TextField(_('description'), blank=True)
+    default_debit_account = models.ForeignKey(
+        Account, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    default_credit_account = models.ForeignKey(
+        Account, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    is_active = models.BooleanField(_('active'), default=True)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT,
+                                   null=True, blank=True, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    history = HistoricalRecords()
+
+    class Meta:
+        verbose_name = _('journal')
+        verbose_name_plural = _('journals')
+        unique_together = [['company', 'code']]
+        ordering = ['code']
+
+    def __str__(self):
+        return f'{self.code} - {self.name}'
+
+
+class JournalEntry(models.Model):
+    """A journal entry (écriture comptable) with its debit/credit lines."""
+
+    STATES = [
+        ('DRAFT', _('Draft')),
+        ('POSTED', _('Posted')),
+        ('CANCELLED', _('Cancelled')),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=_uuid7, editable=False)
+    company = models.ForeignKey(Company, on_delete=models.CASCADE,
+                                related_name='journal_entries')
+    journal = models.ForeignKey(Journal, on_delete=models.PROTECT)
+    # Uniqueness is per company (see unique_together); a global unique
+    # index across every tenant's numbering would only duplicate it.
+    entry_number = models.CharField(_('entry number'), max_length=50)
+    date = models.DateField(_('date'), default=timezone.localdate)
+    reference = models.CharField(_('reference'), max_length=100, blank=True)
+    description = models.TextField(_('description'), blank=True)
+    state = models.CharField(_('state'), max_length=10, choices=STATES,
+                             default='DRAFT')
+    total_debit_cents = models.BigIntegerField(_('total debit (centimes)'),
+                                               default=0)
+    total_credit_cents = models.BigIntegerField(_('total credit (centimes)'),
+                                                default=0)
+    posted_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT,
+                                  null=True, blank=True, related_name='+')
+    posted_at = models.DateTimeField(_('posted at'), null=True, blank=True)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT,
+                                   null=True, blank=True, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    history = HistoricalRecords()
+
+    class Meta:
+        verbose_name = _('journal entry')
+        verbose_name_plural = _('journal entries')
+        unique_together = [['company', 'entry_number']]
+        ordering = ['-date', '-created_at']
+        indexes = [
+            # The statement aggregates all filter on state + date range.
+            models.Index(fields=['state', 'date'], name='je_state_date_idx'),
+            # Balance math only ever reads POSTED entries; drafts and
+            # cancellations stay out of this index entirely.
+            models.Index(fields=['company', 'date'], name='je_posted_idx',
+                         condition=models.Q(state='POSTED')),
+        ]
+
+    def __str__(self):
+        return self.entry_number
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Stash the state as it came off disk so the pre_save handler
+        # can detect transitions without re-selecting the row.
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_state = instance.state
+        return instance
+
+    def save(self, *args, **kwargs):
+        if not self.entry_number:
+            self.entry_number = self._generate_entry_number()
+        super().save(*args, **kwargs)
+
+    def _generate_entry_number(self):
+        return DocumentSequence.get_next_number(
+            self.company, 'JOURNAL_ENTRY', prefix=f'JE-{self.date.year}-',
+        )
+
+    @property
+    def total_debit(self):
+        return _amount(self.total_debit_cents)
+
+    @total_debit.setter
+    def total_debit(self, value):
+        self.total_debit_cents = _cents(value)
+
+    @property
+    def total_credit(self):
+        return _amount(self.total_credit_cents)
+
+    @total_credit.setter
+    def total_credit(self, value):
+        self.total_credit_cents = _cents(value)
+
+    def calculate_totals(self):
+        """Recompute the frozen totals from the lines.
+
+        Only the two amounts are read, so the lines ship as tuples
+        rather than hydrated model instances, and the accumulation is
+        plain integer addition over the centime columns.
+        """
+        total_debit = 0
+        total_credit = 0
+        for debit_cents, credit_cents in self.lines.values_list(
+                'debit_cents', 'credit_cents'):
+            total_debit += debit_cents
+            total_credit += credit_cents
+        self.total_debit_cents = total_debit
+        self.total_credit_cents = total_credit
+        return _amount(total_debit), _amount(total_credit)
+
+    def is_balanced(self):
+        total_debit, total_credit = self.calculate_totals()
+        return total_debit == total_credit
+
+    @transaction.atomic
+    def post(self, user=None):
+        """Post the entry: validate, freeze and update account balances."""
+        if self.state != 'DRAFT':
+            raise ValidationError(_('Only draft entries can be posted.'))
+        # One fetch of the amounts covers the existence check, the
+        # balance validation and the frozen totals; exists() plus
+        # is_balanced() plus calculate_totals() scanned the same rows
+        # three times.
+        amounts = list(self.lines.values_list('debit_cents',
+                                              'credit_cents'))
+        if not amounts:
+            raise ValidationError(_('Cannot post an entry without lines.'))
+        total_debit = 0
+        total_credit = 0
+        for debit_cents, credit_cents in amounts:
+            total_debit += debit_cents
+            total_credit += credit_cents
+        if total_debit != total_credit:
+            raise ValidationError(_('Entry is not balanced.'))
+        self.total_debit_cents = total_debit
+        self.total_credit_cents = total_credit
+        self.state = 'POSTED'
+        self.posted_by = user
+        self.posted_at = timezone.now()
+        self.save()
+        self._update_account_balances()
+
+    def _update_account_balances(self):
+        """Refresh current_balance of every account touched by this entry.
+
+        One grouped aggregate computes the signed delta per account and
+        one UPDATE applies them all; the old per-line loop cost a fetch,
+        an UPDATE and a history INSERT per account. ``update()`` skips
+        ``save()`` on purpose — current_balance is derived data and not
+        worth a history snapshot per posting.
+        """
+        per_account = list(
+            self.lines.values('account_id').annotate(
+                delta=models.Sum(models.Case(
+                    models.When(
+                        account__normal_balance='DEBIT',
+                        then=models.F('debit_cents')
+                        - models.F('credit_cents')),
+                    default=models.F('credit_cents')
+                    - models.F('debit_cents'),
+                    output_field=models.BigIntegerField(),
+                )),
+            )
+        )
+        if not per_account:
+            return
+        # Lock the touched accounts in pk order before writing: two
+        # concurrent postings over overlapping accounts then queue on
+        # the first common row instead of deadlocking, since both
+        # acquire in the same order. post() holds the transaction.
+        touched = [row['account_id'] for row in per_account]
+        list(Account.objects.select_for_update()
+             .filter(pk__in=touched).order_by('pk')
+             .values_list('pk', flat=True))
+        Account.objects.filter(pk__in=touched).update(
+            current_cents=models.F('current_cents') + models.Case(
+                *[models.When(pk=row['account_id'],
+                              then=models.Value(row['delta']))
+                  for row in per_account],
+                output_field=models.BigIntegerField(),
+            ),
+        )
+
+    @transaction.atomic
+    def reverse(self, user=None, date=None):
+        """Create and post the reversal (extourne) of this entry."""
+        if self.state != 'POSTED':
+            raise ValidationError(_('Only posted entries can be reversed.'))
+        reversal = JournalEntry.objects.create(
+            company=self.company,
+            journal=self.journal,
+            date=date or timezone.localdate(),
+            reference=self.entry_number,
+            description=f'Reversal of {self.entry_number}',
+            created_by=user,
+        )
+        # One INSERT for all mirrored lines instead of one per line; the
+        # history snapshot batches the same way since bulk_create fires
+        # no per-row signals. The only() list trims the row to the six
+        # columns the mirror reads — and keeps journal_entry_id in it,
+        # because touching a deferred FK attname would cost a
+        # refresh-SELECT per line.
+        source_lines = list(self.lines.only(
+            'sequence', 'account_id', 'description',
+            'debit_cents', 'credit_cents', 'reference',
+            'journal_entry_id',
+        ))
+        reversal_lines = JournalEntryLine.objects.bulk_create([
+            JournalEntryLine(
+                journal_entry=reversal,
+                sequence=line.sequence,
+                account_id=line.account_id,
+                description=f'Reversal: {line.description}',
+                debit_cents=line.credit_cents,
+                credit_cents=line.debit_cents,
+                reference=line.reference,
+            )
+            for line in source_lines
+        ], batch_size=500)
+        JournalEntryLine.history.bulk_history_create(reversal_lines)
+        reversal.post(user=user)
+        return reversal
+
+
+class JournalEntryLine(models.Model):
+    """One debit or credit line of a journal entry."""
+
+    id = models.UUIDField(primary_key=True, default=_uuid7, editable=False)
+    journal_entry = models.ForeignKey(JournalEntry, on_delete=models.CASCADE,
+                                      related_name='lines')
+    sequence = models.PositiveIntegerField(_('sequence'), default=1)
+    account = models.ForeignKey(Account, on_delete=models.PROTECT,
+                                related_name='journal_lines')
+    description = models.CharField(_('description'), max_length=255, blank=True)
+    # Amounts are exact two-decimal dirhams, stored as integer centimes:
+    # a bigint row is a fixed 8 bytes against NUMERIC's variable 8-20,
+    # SUM(bigint) beats SUM(numeric) in the aggregates, and Python-side
+    # accumulation is int addition instead of Decimal objects. The
+    # *_amount properties keep the Decimal API at the edges.
+    debit_cents = models.BigIntegerField(_('debit (centimes)'), default=0)
+    credit_cents = models.BigIntegerField(_('credit (centimes)'), default=0)
+    reference = models.CharField(_('reference'), max_length=100, blank=True)
+    reconciled = models.BooleanField(_('reconciled'), default=False)
+    reconciled_by = models.ForeignKey(settings.AUTH_USER_MODEL,
+                                      on_delete=models.PROTECT, null=True,
+                                      blank=True, related_name='+')
+    reconciled_at = models.DateTimeField(_('reconciled at'), null=True, blank=True)
+
+    history = HistoricalRecords()
+
+    class Meta:
+        verbose_name = _('journal entry line')
+        verbose_name_plural = _('journal entry lines')
+        ordering = ['sequence']
+        indexes = [
+            # Covers the balance aggregates: the planner can answer the
+            # debit/credit SUMs from an index-only scan.
+            models.Index(fields=['account', 'journal_entry'],
+                         include=['debit_cents', 'credit_cents'],
+                         name='jel_acct_je_cover'),
+        ]
+
+    def __str__(self):
+        return f'{self.journal_entry.entry_number} #{self.sequence}'
+
+    @property
+    def debit_amount(self):
+        return _amount(self.debit_cents)
+
+    @debit_amount.setter
+    def debit_amount(self, value):
+        self.debit_cents = _cents(value)
+
+    @property
+    def credit_amount(self):
+        return _amount(self.credit_cents)
+
+    @credit_amount.setter
+    def credit_amount(self, value):
+        self.credit_cents = _cents(value)
+
+    def clean(self):
+        super().clean()
+        if self.debit_cents and self.credit_cents:
+            raise ValidationError(
+                _('A line cannot carry both a debit and a credit amount.'))
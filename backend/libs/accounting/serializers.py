@@ -0,0 +1,117 @@
+"""DRF serializers for the accounting API."""
+from rest_framework import serializers
+
+from libs.core.serializers import PrefetchingSerializerMixin
+
+from .models import (Account, AccountType, Journal, JournalEntry,
+                     JournalEntryLine)
+
+
+class AccountTypeSerializer(serializers.ModelSerializer):
+    """Serializes one node of the PCGM classification, children included.
+
+    The tree endpoints pair this with a viewset queryset that prefetches
+    the active children per level and annotates the account counts, so
+    serializing a whole chart issues a fixed handful of queries instead
+    of one per node.
+    """
+
+    children = serializers.SerializerMethodField()
+    # Filled by the viewset's Count annotation; one grouped query for
+    # the whole tree instead of a COUNT per node.
+    accounts_count = serializers.IntegerField(
+        source='accounts_count_annotated', read_only=True, default=None)
+
+    class Meta:
+        model = AccountType
+        fields = ['id', 'code', 'name', 'name_arabic', 'category',
+                  'normal_balance', 'level', 'is_active', 'accounts_count',
+                  'children']
+
+    def get_children(self, obj):
+        # children.all() reads the prefetch cache; a filtered queryset
+        # here would bypass it and fall back to one query per node.
+        return AccountTypeSerializer(obj.children.all(), many=True).data
+
+
+class AccountSerializer(PrefetchingSerializerMixin,
+                        serializers.ModelSerializer):
+    account_type_code = serializers.CharField(source='account_type.code',
+                                              read_only=True)
+    account_type_name = serializers.CharField(source='account_type.name',
+                                              read_only=True)
+    opening_balance = serializers.DecimalField(max_digits=15,
+                                               decimal_places=2)
+    current_balance = serializers.DecimalField(max_digits=15,
+                                               decimal_places=2,
+                                               read_only=True)
+
+    class Meta:
+        model = Account
+        fields = ['id', 'code', 'name', 'name_arabic', 'account_type',
+                  'account_type_code', 'account_type_name', 'currency',
+                  'opening_balance', 'current_balance', 'allow_posting',
+                  'is_active']
+
+
+class JournalSerializer(PrefetchingSerializerMixin,
+                        serializers.ModelSerializer):
+    # Filled by the viewset's Count annotation: one query for the whole
+    # list where a per-journal journalentry_set.count() cost J+1.
+    entries_count = serializers.IntegerField(read_only=True, default=None)
+
+    class Meta:
+        model = Journal
+        fields = ['id', 'code', 'name', 'name_arabic', 'type',
+                  'description', 'is_active', 'entries_count']
+
+
+class JournalEntryLineSerializer(PrefetchingSerializerMixin,
+                                 serializers.ModelSerializer):
+    account_code = serializers.CharField(source='account.code',
+                                         read_only=True)
+    account_name = serializers.CharField(source='account.name',
+                                         read_only=True)
+    debit_amount = serializers.DecimalField(max_digits=15, decimal_places=2)
+    credit_amount = serializers.DecimalField(max_digits=15, decimal_places=2)
+
+    class Meta:
+        model = JournalEntryLine
+        fields = ['id', 'sequence', 'account', 'account_code',
+                  'account_name', 'description', 'debit_amount',
+                  'credit_amount', 'reference', 'reconciled']
+
+
+class JournalEntrySerializer(PrefetchingSerializerMixin,
+                             serializers.ModelSerializer):
+    journal_code = serializers.CharField(source='journal.code',
+                                         read_only=True)
+    lines = JournalEntryLineSerializer(many=True, read_only=True)
+    total_debit = serializers.DecimalField(max_digits=15, decimal_places=2,
+                                           read_only=True)
+    total_credit = serializers.DecimalField(max_digits=15, decimal_places=2,
+                                            read_only=True)
+    is_balanced = serializers.SerializerMethodField()
+    can_post = serializers.SerializerMethodField()
+
+    class Meta:
+        model = JournalEntry
+        fields = ['id', 'entry_number', 'date', 'journal', 'journal_code',
+                  'reference', 'description', 'state', 'total_debit',
+                  'total_credit', 'is_balanced', 'can_post', 'lines']
+        read_only_fields = ['entry_number', 'state']
+
+    def get_is_balanced(self, obj):
+        # Posted entries carry frozen totals; drafts sum their lines
+        # from the prefetch cache — is_balanced() would re-aggregate in
+        # SQL per entry.
+        if obj.state != 'DRAFT':
+            return obj.total_debit_cents == obj.total_credit_cents
+        lines = obj.lines.all()
+        return (sum(line.debit_cents for line in lines)
+                == sum(line.credit_cents for line in lines))
+
+    def get_can_post(self, obj):
+        # bool() over the prefetched lines instead of an EXISTS query
+        # per entry.
+        return obj.state == 'DRAFT' and bool(obj.lines.all())
@@ -0,0 +1,27 @@
+"""State-change tracking for workflow models.
+
+Posting and cancellation side effects need to know what the ``state``
+column held before a save. ``from_db`` stashes the loaded value on the
+instance, so the handler below exposes ``_previous_state`` without the
+extra SELECT the old ``save()`` wrapper issued on every write.
+"""
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Account, AccountType, JournalEntry
+
+
+@receiver(pre_save, sender=JournalEntry)
+def stash_previous_state(sender, instance, **kwargs):
+    # Instances built in memory (creates) never passed through from_db
+    # and have no previous state.
+    instance._previous_state = getattr(instance, '_loaded_state', None)
+
+
+@receiver(post_save, sender=AccountType)
+def propagate_normal_balance(sender, instance, **kwargs):
+    # Keep the denormalized Account.normal_balance in sync; one UPDATE
+    # covers the (rare) reclassification of a type.
+    Account.objects.filter(account_type=instance).exclude(
+        normal_balance=instance.normal_balance,
+    ).update(normal_balance=instance.normal_balance)
@@ -0,0 +1,212 @@
+from datetime import date
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+
+from libs.core.models import Company
+
+from .financial_statements import FinancialStatementsService
+from .models import (Account, AccountType, Journal, JournalEntry,
+                     JournalEntryLine)
+from .services import JournalEntryService
+
+
+class CentimeRepresentationTest(SimpleTestCase):
+    """The Decimal properties are the edge of the integer-cent storage."""
+
+    def test_setters_round_trip(self):
+        line = JournalEntryLine(debit_amount=Decimal('123.45'))
+        self.assertEqual(line.debit_cents, 12345)
+        self.assertEqual(line.debit_amount, Decimal('123.45'))
+        self.assertEqual(line.debit_amount.as_tuple().exponent, -2)
+
+    def test_float_input_rounds_at_the_centime(self):
+        # Decimal(12.1).scaleb(2) is 1209.99…; truncation would lose one.
+        line = JournalEntryLine(debit_amount=12.1, credit_amount=0.1 + 0.2)
+        self.assertEqual(line.debit_cents, 1210)
+        self.assertEqual(line.credit_cents, 30)
+
+    def test_entry_and_account_facades(self):
+        entry = JournalEntry(total_debit=Decimal('99.99'))
+        self.assertEqual(entry.total_debit_cents, 9999)
+        self.assertEqual(entry.total_credit, Decimal('0.00'))
+        account = Account(opening_balance=Decimal('-7.01'))
+        self.assertEqual(account.opening_cents, -701)
+        self.assertEqual(account.opening_balance, Decimal('-7.01'))
+
+
+class LedgerFixtureMixin:
+    """One company with a DEBIT-normal and a CREDIT-normal account."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = Company.objects.create(
+            name='Atlas SARL', ice='001234567000090')
+        cls.type_bank = AccountType.objects.create(
+            company=cls.company, code='51', name='Trésorerie',
+            category='ASSET', normal_balance='DEBIT', level=1)
+        cls.type_sales = AccountType.objects.create(
+            company=cls.company, code='71',
+            name="Produits d'exploitation", category='REVENUE',
+            normal_balance='CREDIT', level=1)
+        cls.bank = Account.objects.create(
+            company=cls.company, code='514100', name='Banque',
+            account_type=cls.type_bank)
+        cls.sales = Account.objects.create(
+            company=cls.company, code='711100', name='Ventes',
+            account_type=cls.type_sales)
+        cls.journal = Journal.objects.create(
+            company=cls.company, code='VTE', name='Journal des ventes',
+            type='SALE')
+
+    def _entry(self, lines, entry_date=date(2024, 6, 15)):
+        entry = JournalEntry.objects.create(
+            company=self.company, journal=self.journal, date=entry_date)
+        JournalEntryLine.objects.bulk_create([
+            JournalEntryLine(
+                journal_entry=entry, sequence=sequence, account=account,
+                debit_amount=debit, credit_amount=credit)
+            for sequence, (account, debit, credit) in enumerate(lines, 1)
+        ])
+        return entry
+
+
+class JournalEntryPostingTest(LedgerFixtureMixin, TestCase):
+
+    def test_post_freezes_totals_and_state(self):
+        entry = self._entry([
+            (self.bank, Decimal('1000.00'), Decimal('0.00')),
+            (self.sales, Decimal('0.00'), Decimal('1000.00')),
+        ])
+        entry.post()
+        entry.refresh_from_db()
+        self.assertEqual(entry.state, 'POSTED')
+        self.assertEqual(entry.total_debit, Decimal('1000.00'))
+        self.assertEqual(entry.total_credit, Decimal('1000.00'))
+
+    def test_post_rejects_unbalanced_entry(self):
+        entry = self._entry([
+            (self.bank, Decimal('1000.00'), Decimal('0.00')),
+            (self.sales, Decimal('0.00'), Decimal('999.99')),
+        ])
+        with self.assertRaises(ValidationError):
+            entry.post()
+        entry.refresh_from_db()
+        self.assertEqual(entry.state, 'DRAFT')
+
+    def test_post_rejects_entry_without_lines(self):
+        entry = self._entry([])
+        with self.assertRaises(ValidationError):
+            entry.post()
+
+    def test_post_applies_normal_balance_signed_deltas(self):
+        self._entry([
+            (self.bank, Decimal('1000.00'), Decimal('0.00')),
+            (self.sales, Decimal('0.00'), Decimal('1000.00')),
+        ]).post()
+        self.bank.refresh_from_db()
+        self.sales.refresh_from_db()
+        # Both balances grow: debit minus credit for the DEBIT-normal
+        # account, credit minus debit for the CREDIT-normal one.
+        self.assertEqual(self.bank.current_balance, Decimal('1000.00'))
+        self.assertEqual(self.sales.current_balance, Decimal('1000.00'))
+
+    def test_reverse_mirrors_lines_and_restores_balances(self):
+        entry = self._entry([
+            (self.bank, Decimal('250.00'), Decimal('0.00')),
+            (self.sales, Decimal('0.00'), Decimal('250.00')),
+        ])
+        entry.post()
+        reversal = entry.reverse()
+        self.assertEqual(reversal.state, 'POSTED')
+        mirrored = list(reversal.lines.order_by('sequence'))
+        self.assertEqual(
+            [(line.debit_amount, line.credit_amount) for line in mirrored],
+            [(Decimal('0.00'), Decimal('250.00')),
+             (Decimal('250.00'), Decimal('0.00'))],
+        )
+        self.bank.refresh_from_db()
+        self.sales.refresh_from_db()
+        self.assertEqual(self.bank.current_balance, Decimal('0.00'))
+        self.assertEqual(self.sales.current_balance, Decimal('0.00'))
+
+    def test_rebuild_matches_incremental_balances(self):
+        self._entry([
+            (self.bank, Decimal('1000.00'), Decimal('0.00')),
+            (self.sales, Decimal('0.00'), Decimal('1000.00')),
+        ]).post()
+        self._entry([
+            (self.bank, Decimal('0.00'), Decimal('150.00')),
+            (self.sales, Decimal('150.00'), Decimal('0.00')),
+        ]).post()
+        incremental = {
+            account.pk: account.current_balance
+            for account in Account.objects.filter(company=self.company)
+        }
+        # Scramble the stored balances, then rebuild from the lines.
+        Account.objects.filter(company=self.company).update(current_cents=12345)
+        written = Account.rebuild_balances(self.company)
+        self.assertEqual(written, 2)
+        rebuilt = {
+            account.pk: account.current_balance
+            for account in Account.objects.filter(company=self.company)
+        }
+        self.assertEqual(rebuilt, incremental)
+
+
+class JournalEntryServiceTest(LedgerFixtureMixin, TestCase):
+
+    def test_create_journal_entry_resolves_codes_and_totals(self):
+        entry = JournalEntryService.create_journal_entry(
+            company=self.company, journal=self.journal,
+            date=date(2024, 6, 15),
+            lines_data=[
+                {'account_code': '514100',
+                 'debit_amount': Decimal('1000.00')},
+                {'account_code': '711100',
+                 'credit_amount': Decimal('1000.00')},
+            ],
+        )
+        lines = list(entry.lines.order_by('sequence'))
+        self.assertEqual(
+            [(line.account, line.debit_amount, line.credit_amount)
+             for line in lines],
+            [(self.bank, Decimal('1000.00'), Decimal('0.00')),
+             (self.sales, Decimal('0.00'), Decimal('1000.00'))],
+        )
+        entry.refresh_from_db()
+        self.assertEqual(entry.total_debit, Decimal('1000.00'))
+        self.assertEqual(entry.total_credit, Decimal('1000.00'))
+
+    def test_create_journal_entry_rejects_unknown_codes(self):
+        with self.assertRaisesMessage(ValidationError, '999999'):
+            JournalEntryService.create_journal_entry(
+                company=self.company, journal=self.journal,
+                date=date(2024, 6, 15),
+                lines_data=[
+                    {'account_code': '514100',
+                     'debit_amount': Decimal('10.00')},
+                    {'account_code': '999999',
+                     'credit_amount': Decimal('10.00')},
+                ],
+            )
+        self.assertFalse(JournalEntry.objects.exists())
+
+
+class TrialBalanceTest(LedgerFixtureMixin, TestCase):
+
+    def test_trial_balance_balances(self):
+        self._entry([
+            (self.bank, Decimal('1000.00'), Decimal('0.00')),
+            (self.sales, Decimal('0.00'), Decimal('1000.00')),
+        ]).post()
+        trial_balance = FinancialStatementsService.generate_trial_balance(
+            self.company, date(2024, 6, 30))
+        self.assertEqual(trial_balance['total_debit'], Decimal('1000.00'))
+        self.assertEqual(trial_balance['total_credit'], Decimal('1000.00'))
+        lines = {line['code']: line for line in trial_balance['lines']}
+        self.assertEqual(lines['514100']['closing_balance'],
+                         Decimal('1000.00'))
+        self.assertEqual(lines['711100']['closing_balance'],
+                         Decimal('1000.00'))
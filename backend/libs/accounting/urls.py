@@ -0,0 +1,13 @@
+"""URL routing for the accounting API."""
+from rest_framework.routers import DefaultRouter
+
+from . import views
+
+router = DefaultRouter()
+router.register('account-types', views.AccountTypeViewSet,
+                basename='account-type')
+router.register('accounts', views.AccountViewSet)
+router.register('journals', views.JournalViewSet)
+router.register('journal-entries', views.JournalEntryViewSet)
+
+urlpatterns = router.urls
@@ -0,0 +1,65 @@
+"""API viewsets for the accounting app."""
+from django.db.models import Count, Prefetch, Q
+from rest_framework import viewsets
+
+from .models import Account, AccountType, Journal, JournalEntry
+from .serializers import (AccountSerializer, AccountTypeSerializer,
+                          JournalEntrySerializer, JournalSerializer)
+
+
+class AccountTypeViewSet(viewsets.ModelViewSet):
+    """The PCGM classification, served as a tree from its roots."""
+
+    serializer_class = AccountTypeSerializer
+
+    def get_queryset(self):
+        # The chart is three levels deep (classe, rubrique, poste), so
+        # prefetching the active children per level plus the account
+        # counts serializes the whole tree in four queries; the naive
+        # per-node children.filter()/accounts.count() pair cost two per
+        # node.
+        active = AccountType.objects.filter(is_active=True).annotate(
+            accounts_count_annotated=Count(
+                'accounts', filter=Q(accounts__is_active=True)),
+        )
+        queryset = (
+            AccountType.objects
+            .annotate(accounts_count_annotated=Count(
+                'accounts', filter=Q(accounts__is_active=True)))
+            .prefetch_related(
+                Prefetch('children', queryset=active),
+                Prefetch('children__children', queryset=active),
+                Prefetch('children__children__children', queryset=active),
+            )
+        )
+        if self.action == 'list':
+            # Only the list renders the tree from its roots; detail
+            # routes must address any node.
+            queryset = queryset.filter(parent__isnull=True)
+        return queryset.order_by('code')
+
+
+# The flat viewsets derive their eager loading from what the serializer
+# declares (see PrefetchingSerializerMixin): the entry queryset ends up
+# with select_related('journal') and a lines prefetch whose rows carry
+# their account pre-joined, so a list page loads in two queries
+# regardless of size — and a new source='x.y' field cannot silently
+# reintroduce an N+1.
+
+class AccountViewSet(viewsets.ModelViewSet):
+    queryset = AccountSerializer.setup_eager_loading(
+        Account.objects.all().order_by('code'))
+    serializer_class = AccountSerializer
+
+
+class JournalViewSet(viewsets.ModelViewSet):
+    queryset = JournalSerializer.setup_eager_loading(
+        Journal.objects.annotate(entries_count=Count('journalentry'))
+        .order_by('code'))
+    serializer_class = JournalSerializer
+
+
+class JournalEntryViewSet(viewsets.ModelViewSet):
+    queryset = JournalEntrySerializer.setup_eager_loading(
+        JournalEntry.objects.all())
+    serializer_class = JournalEntrySerializer
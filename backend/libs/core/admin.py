@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import Company
+
+
+@admin.register(Company)
+class CompanyAdmin(admin.ModelAdmin):
+    list_display = ['name', 'ice', 'if_number', 'city', 'currency', 'is_active']
+    list_filter = ['is_active', 'city']
+    search_fields = ['name', 'ice', 'if_number', 'rc_number']
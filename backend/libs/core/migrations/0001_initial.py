@@ -0,0 +1,37 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Company',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='name')),
+                ('name_arabic', models.CharField(blank=True, max_length=255, verbose_name='name (arabic)')),
+                ('ice', models.CharField(help_text="Identifiant Commun de l'Entreprise", max_length=15, unique=True, verbose_name='ICE')),
+                ('if_number', models.CharField(blank=True, help_text='Identifiant Fiscal', max_length=20, verbose_name='IF')),
+                ('rc_number', models.CharField(blank=True, help_text='Registre de Commerce', max_length=20, verbose_name='RC')),
+                ('cnss_number', models.CharField(blank=True, max_length=20, verbose_name='CNSS')),
+                ('address', models.TextField(blank=True, verbose_name='address')),
+                ('city', models.CharField(blank=True, max_length=100, verbose_name='city')),
+                ('currency', models.CharField(default='MAD', max_length=3, verbose_name='currency')),
+                ('is_active', models.BooleanField(default=True, verbose_name='active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'company',
+                'verbose_name_plural': 'companies',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('document_type', models.CharField(max_length=30, verbose_name='document type')),
+                ('prefix', models.CharField(blank=True, max_length=20, verbose_name='prefix')),
+                ('padding', models.PositiveSmallIntegerField(default=5, verbose_name='padding')),
+                ('current_number', models.PositiveBigIntegerField(default=0, verbose_name='current number')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='document_sequences', to='core.company')),
+            ],
+            options={
+                'verbose_name': 'document sequence',
+                'verbose_name_plural': 'document sequences',
+                'unique_together': {('company', 'document_type', 'prefix')},
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""Shared serializer plumbing for the API apps."""
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+class PrefetchingSerializerMixin:
+    """Derives eager loading from the fields a serializer declares.
+
+    Every ``source='rel.attr'`` field names a relation the serializer
+    will touch per instance, and every nested serializer names a
+    relation it will iterate — the two classic ways a newly added field
+    silently reintroduces an N+1. ``setup_eager_loading`` walks the
+    declared fields once and applies the matching ``select_related`` /
+    ``prefetch_related``, recursing into nested serializers so their
+    own dotted sources are pre-joined inside the prefetch. Viewsets
+    build their querysets through it and stay flat-query as fields
+    come and go.
+    """
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        select = set()
+        prefetches = []
+        for field in cls().fields.values():
+            target = field
+            if isinstance(field, serializers.ListSerializer):
+                target = field.child
+            if isinstance(target, serializers.ModelSerializer):
+                # Nested rows come through prefetch_related; the
+                # related model's Meta.ordering already orders them.
+                related_queryset = target.Meta.model.objects.all()
+                if isinstance(target, PrefetchingSerializerMixin):
+                    related_queryset = type(target).setup_eager_loading(
+                        related_queryset)
+                prefetches.append(
+                    Prefetch(field.source, queryset=related_queryset))
+            elif field.source and '.' in field.source:
+                select.add(field.source.split('.', 1)[0])
+        if select:
+            queryset = queryset.select_related(*sorted(select))
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
@@ -0,0 +1,37 @@
+from django.contrib import admin
+
+from .models import Tax, TaxRate, TaxRateVersion
+
+
+class TaxRateInline(admin.TabularInline):
+    model = TaxRate
+    extra = 0
+
+
+@admin.register(Tax)
+class TaxAdmin(admin.ModelAdmin):
+    list_display = ['code', 'name', 'type', 'calculation_method', 'is_active', 'company']
+    list_filter = ['type', 'is_active', 'company']
+    search_fields = ['code', 'name', 'name_arabic']
+    inlines = [TaxRateInline]
+
+
+class TaxRateVersionInline(admin.TabularInline):
+    model = TaxRateVersion
+    extra = 0
+
+
+@admin.register(TaxRate)
+class TaxRateAdmin(admin.ModelAdmin):
+    list_display = ['tax', 'name', 'rate_pct', 'fixed_amount', 'is_active']
+    list_filter = ['is_active', 'tax__type']
+    search_fields = ['name', 'tax__code']
+    inlines = [TaxRateVersionInline]
+
+
+@admin.register(TaxRateVersion)
+class TaxRateVersionAdmin(admin.ModelAdmin):
+    list_display = ['tax_rate', 'valid_from', 'valid_to', 'override_rate_pct',
+                    'withheld_flag', 'is_active']
+    list_filter = ['is_active', 'withheld_flag']
+    date_hierarchy = 'valid_from'
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class TaxEngineConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'libs.tax_engine'
+    label = 'tax_engine'
+    verbose_name = 'Tax engine'
+
+    def ready(self):
+        from . import signals  # noqa: F401
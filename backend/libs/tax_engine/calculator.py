@@ -0,0 +1,386 @@
+"""
+Tax calculation over document lines (invoices, avoirs, fee notes).
+
+``TaxCalculator`` resolves the rate versions in force on the calculation
+date and applies them line by line, splitting withheld (RAS) amounts from
+added (TVA) amounts.
+"""
+from collections import namedtuple
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+from django.utils import timezone
+
+from ._kernel import calc_line
+from .models import Tax, TaxRateVersion
+
+# Module-level Decimal constants: skip Decimal-from-str construction in the
+# per-line path, and multiply by _PCT instead of dividing by 100 (Decimal
+# division is materially slower than multiplication).
+_ONE = Decimal('1')
+_CENT = Decimal('0.01')
+_PCT = Decimal('0.01')
+
+
+# slots: no per-instance __dict__ on objects created per invoice line;
+# frozen: lines and results are value objects, safe to share and reuse.
+@dataclass(slots=True, frozen=True)
+class TaxLineItem:
+    """One document line to be taxed."""
+
+    description: str
+    quantity: Decimal
+    unit_price: Decimal
+    discount_percent: Decimal = Decimal('0.00')
+    tax_rates: list = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class LineTaxResult:
+    """Per-line amounts, all quantized to the centime."""
+
+    base_amount: Decimal
+    tax_amount: Decimal
+    withheld_amount: Decimal
+    total_amount: Decimal
+    tax_details: list = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class DocumentTaxResult:
+    """Document totals plus the per-line results."""
+
+    total_base: Decimal
+    total_tax: Decimal
+    total_withheld: Decimal
+    total_amount: Decimal
+    lines: list = field(default_factory=list)
+
+
+# One row of the precompiled rate table: everything the hot path needs,
+# resolved once at calculator construction.
+RateEntry = namedtuple(
+    'RateEntry',
+    ['pct', 'bp', 'withholding_bp', 'withheld', 'is_percentage', 'fixed_amount'],
+)
+
+
+class TaxCalculator:
+    """Computes taxes for document lines on a given date.
+
+    At construction, every rate version in force on ``calculation_date``
+    is flattened into ``_rate_table`` with a single values_list query;
+    per-line resolution is then a plain dict get with no version-by-date
+    scan and no model instantiation — every path, including fixed-amount
+    and inclusive pricing, runs off the tuples.
+    """
+
+    def __init__(self, company=None, calculation_date=None):
+        self.company = company
+        self.calculation_date = calculation_date or timezone.now().date()
+        self.inclusive_taxes = False
+        # Precomputed pct * 0.01 multipliers, filled by _build_rate_table.
+        self._rate_decimal = {}
+        self._rate_table = self._build_rate_table()
+        # Withheld (RAS) rate ids, partitioned once so per-line code does a
+        # frozenset membership test instead of an attribute chain, and each
+        # rate lands in exactly one of the added/withheld buckets.
+        self._withheld_ids = frozenset(
+            rate_id for rate_id, entry in self._rate_table.items()
+            if entry.withheld
+        )
+
+    def _build_rate_table(self):
+        """Flatten the rates in force on the calculation date."""
+        versions = TaxRateVersion.raw_objects.filter(
+            valid_range__contains=self.calculation_date,
+            valid_from__lte=self.calculation_date,
+            is_active=True,
+        )
+        if self.company is not None:
+            versions = versions.filter(company=self.company)
+        table = {}
+        # Ascending valid_from makes the last write win, matching
+        # get_current_rate; the filter above is the full validity
+        # predicate, so no Python-side re-check is needed.
+        rows = versions.order_by('valid_from').values_list(
+            'tax_rate_id', 'override_rate_pct', 'tax_rate__rate_pct',
+            'withholding_rate_pct', 'withheld_flag', 'effective_rate_bp',
+            'tax_rate__tax__calculation_method', 'tax_rate__fixed_amount',
+        )
+        for rate_id, override, base_pct, wh_pct, withheld, bp, method, fixed in rows:
+            pct = override if override is not None else (base_pct or Decimal('0.00'))
+            withholding_bp = int(wh_pct * 100) if wh_pct is not None else bp
+            table[rate_id] = RateEntry(
+                pct=pct, bp=bp, withholding_bp=withholding_bp,
+                withheld=withheld, is_percentage=(method == 'PERCENTAGE'),
+                fixed_amount=fixed or Decimal('0.00'),
+            )
+            self._rate_decimal[rate_id] = pct * _PCT
+        return table
+
+    def calculate_line_taxes(self, line):
+        """Compute base, tax and withheld amounts for one line.
+
+        Percentage-only, tax-exclusive lines (the overwhelming majority)
+        run through the compiled float64 kernel and are quantized back to
+        Decimal at the boundary; fixed-amount or tax-inclusive lines keep
+        the Decimal path.
+        """
+        # Majority shape — one added percentage rate, no discount, prices
+        # tax-exclusive — returns straight away without touching the
+        # kernel or building entry lists.
+        if (
+            len(line.tax_rates) == 1
+            and not line.discount_percent
+            and not self.inclusive_taxes
+        ):
+            rate = line.tax_rates[0]
+            entry = self._rate_table.get(rate.pk)
+            if (entry is not None and entry.is_percentage
+                    and rate.pk not in self._withheld_ids):
+                base = (line.quantity * line.unit_price).quantize(
+                    _CENT, rounding=ROUND_HALF_UP)
+                tax = (base * Decimal(entry.bp) / 10000).quantize(
+                    _CENT, rounding=ROUND_HALF_UP)
+                return LineTaxResult(
+                    base_amount=base,
+                    tax_amount=tax,
+                    withheld_amount=Decimal('0.00'),
+                    total_amount=base + tax,
+                    tax_details=[(rate.id, entry.pct, tax, False)],
+                )
+
+        entries = [
+            (rate, self._rate_table.get(rate.pk)) for rate in line.tax_rates
+        ]
+        entries = [(rate, entry) for rate, entry in entries if entry is not None]
+        if not self.inclusive_taxes and all(
+            entry.is_percentage for _rate, entry in entries
+        ):
+            return self._calculate_line_fast(line, entries)
+        return self._calculate_line_decimal(line, entries)
+
+    def _calculate_line_fast(self, line, entries):
+        """Kernel-backed path: one float64 pass, Decimal only at the edges."""
+        rate_bps = np.empty(len(entries), dtype=np.float64)
+        withholding_bps = np.empty(len(entries), dtype=np.float64)
+        withheld_mask = np.empty(len(entries), dtype=np.bool_)
+        for i, (_rate, entry) in enumerate(entries):
+            rate_bps[i] = entry.bp
+            withheld_mask[i] = entry.withheld
+            withholding_bps[i] = entry.withholding_bp
+
+        base_f, tax_f, withheld_f, amounts = calc_line(
+            float(line.quantity), float(line.unit_price),
+            float(line.discount_percent or 0), rate_bps, withholding_bps,
+            withheld_mask,
+        )
+        cent = _CENT
+        base = Decimal(repr(base_f)).quantize(cent, rounding=ROUND_HALF_UP)
+        tax_amount = Decimal(repr(tax_f)).quantize(cent, rounding=ROUND_HALF_UP)
+        withheld_amount = Decimal(repr(withheld_f)).quantize(cent, rounding=ROUND_HALF_UP)
+        details = [
+            (rate.id, entry.pct,
+             Decimal(repr(amounts[i])).quantize(cent, rounding=ROUND_HALF_UP),
+             entry.withheld)
+            for i, (rate, entry) in enumerate(entries)
+        ]
+        return LineTaxResult(
+            base_amount=base,
+            tax_amount=tax_amount,
+            withheld_amount=withheld_amount,
+            total_amount=base + tax_amount - withheld_amount,
+            tax_details=details,
+        )
+
+    def _calculate_line_decimal(self, line, entries):
+        """Decimal path for tax-inclusive or fixed-amount lines."""
+        base = line.quantity * line.unit_price
+        if line.discount_percent:
+            base = base * (_ONE - line.discount_percent * _PCT)
+        base = base.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+        if self.inclusive_taxes:
+            # Prices already carry the tax: back the base out before the
+            # per-rate loop, so details and withholding compute from the
+            # tax-exclusive base like in the exclusive path.
+            divisor = _ONE
+            for tax_rate, entry in entries:
+                if not entry.withheld:
+                    divisor += self._rate_decimal.get(tax_rate.pk, entry.pct * _PCT)
+            base = (base / divisor).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+        tax_amount = Decimal('0.00')
+        withheld_amount = Decimal('0.00')
+        details = []
+        for tax_rate, entry in entries:
+            if tax_rate.pk in self._withheld_ids:
+                withheld = (base * Decimal(entry.withholding_bp) / 10000).quantize(_CENT)
+                withheld_amount += withheld
+                details.append((tax_rate.id, entry.pct, withheld, True))
+                continue
+            if not entry.is_percentage:
+                amount = entry.fixed_amount
+            elif base > 0:
+                amount = (base * Decimal(entry.bp) / 10000).quantize(_CENT)
+            else:
+                amount = Decimal('0.00')
+            tax_amount += amount
+            details.append((tax_rate.id, entry.pct, amount, False))
+
+        total = base + tax_amount
+
+        # base, amount and withheld are already cent-quantized; summing them
+        # cannot widen the exponent, so no re-quantize here.
+        return LineTaxResult(
+            base_amount=base,
+            tax_amount=tax_amount,
+            withheld_amount=withheld_amount,
+            total_amount=total - withheld_amount,
+            tax_details=details,
+        )
+
+    def calculate_document_taxes(self, line_items):
+        """Compute every line plus document totals.
+
+        When every line qualifies for the fast path (tax-exclusive,
+        percentage rates), the whole document is computed in one
+        vectorized NumPy pass instead of a Python loop per line.
+        """
+        if line_items and not self.inclusive_taxes and all(
+            entry is not None and entry.is_percentage
+            for line in line_items
+            for entry in (self._rate_table.get(rate.pk) for rate in line.tax_rates)
+        ):
+            return self._calculate_document_vectorized(line_items)
+
+        results = []
+        # Running accumulators, quantized once after the loop.
+        total_base = Decimal('0.000000')
+        total_tax = Decimal('0.000000')
+        total_withheld = Decimal('0.000000')
+        for line in line_items:
+            result = self.calculate_line_taxes(line)
+            results.append(result)
+            total_base += result.base_amount
+            total_tax += result.tax_amount
+            total_withheld += result.withheld_amount
+
+        total_base = total_base.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        total_tax = total_tax.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        total_withheld = total_withheld.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return DocumentTaxResult(
+            total_base=total_base,
+            total_tax=total_tax,
+            total_withheld=total_withheld,
+            total_amount=total_base + total_tax - total_withheld,
+            lines=results,
+        )
+
+    def _calculate_document_vectorized(self, line_items):
+        """Single NumPy pass over all lines of a document."""
+        rate_entries = {}
+        for line in line_items:
+            for rate in line.tax_rates:
+                rate_entries.setdefault(rate.pk, (rate, self._rate_table[rate.pk]))
+        columns = {rate_id: i for i, rate_id in enumerate(rate_entries)}
+        n_lines, n_rates = len(line_items), len(columns)
+
+        qty = np.fromiter((line.quantity for line in line_items),
+                          dtype=np.float64, count=n_lines)
+        price = np.fromiter((line.unit_price for line in line_items),
+                            dtype=np.float64, count=n_lines)
+        disc = np.fromiter((line.discount_percent or 0 for line in line_items),
+                           dtype=np.float64, count=n_lines)
+
+        # Per-column basis points (withholding bp on RAS columns) and mask.
+        bp = np.zeros(n_rates, dtype=np.float64)
+        withheld_col = np.zeros(n_rates, dtype=np.bool_)
+        for rate_id, (rate, entry) in rate_entries.items():
+            col = columns[rate_id]
+            withheld_col[col] = entry.withheld
+            bp[col] = entry.withholding_bp if entry.withheld else entry.bp
+        applies = np.zeros((n_lines, n_rates), dtype=np.bool_)
+        for i, line in enumerate(line_items):
+            for rate in line.tax_rates:
+                applies[i, columns[rate.pk]] = True
+
+        base = qty * price * (1.0 - disc / 100.0)
+        base = np.floor(base * 100.0 + 0.5) / 100.0
+        amounts_raw = base[:, None] * (bp * applies) / 10000.0
+        amounts = np.floor(amounts_raw * 100.0 + 0.5) / 100.0
+        tax_per_line = np.where(withheld_col, 0.0, amounts).sum(axis=1)
+        withheld_per_line = np.where(withheld_col, amounts, 0.0).sum(axis=1)
+
+        cent = _CENT
+        results = []
+        for i, line in enumerate(line_items):
+            base_d = Decimal(repr(base[i])).quantize(cent, rounding=ROUND_HALF_UP)
+            tax_d = Decimal(repr(tax_per_line[i])).quantize(cent, rounding=ROUND_HALF_UP)
+            withheld_d = Decimal(repr(withheld_per_line[i])).quantize(cent, rounding=ROUND_HALF_UP)
+            details = [
+                (rate.id, entry.pct,
+                 Decimal(repr(amounts[i, columns[rate.id]])).quantize(cent, rounding=ROUND_HALF_UP),
+                 entry.withheld)
+                for rate, entry in (rate_entries[r.pk] for r in line.tax_rates)
+            ]
+            results.append(LineTaxResult(
+                base_amount=base_d,
+                tax_amount=tax_d,
+                withheld_amount=withheld_d,
+                total_amount=base_d + tax_d - withheld_d,
+                tax_details=details,
+            ))
+
+        # Progressive-sum rounding: document totals come from the unrounded
+        # running sums with a single final quantize, so cent drift does not
+        # accumulate across lines.
+        total_base = Decimal(repr(base.sum())).quantize(cent, rounding=ROUND_HALF_UP)
+        tax_raw = np.where(withheld_col, 0.0, amounts_raw).sum()
+        withheld_raw = np.where(withheld_col, amounts_raw, 0.0).sum()
+        total_tax = Decimal(repr(tax_raw)).quantize(cent, rounding=ROUND_HALF_UP)
+        total_withheld = Decimal(repr(withheld_raw)).quantize(cent, rounding=ROUND_HALF_UP)
+        return DocumentTaxResult(
+            total_base=total_base,
+            total_tax=total_tax,
+            total_withheld=total_withheld,
+            total_amount=total_base + total_tax - total_withheld,
+            lines=results,
+        )
+
+    @classmethod
+    def get_moroccan_tax_rates(cls, calculation_date=None):
+        """Map ``'<code>_<pct>'`` keys (e.g. ``'TVA_20.00'``) to rates in force.
+
+        Memoized per date: the referential changes a handful of times a
+        year, while reports ask for the same date thousands of times. The
+        returned mapping is read-only so sharing it across callers is safe;
+        the tax_engine signals clear the memo on any referential write.
+        """
+        if calculation_date is None:
+            calculation_date = timezone.now().date()
+        return cls._moroccan_tax_rates(calculation_date)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _moroccan_tax_rates(calculation_date):
+        rows = TaxRateVersion.raw_objects.filter(
+            tax_rate__tax__code__in=(
+                Tax.MOROCCAN_VAT_CODES + Tax.WITHHOLDING_CODES
+            ),
+            tax_rate__tax__is_active=True,
+            valid_range__contains=calculation_date,
+            valid_from__lte=calculation_date,
+            is_active=True,
+        ).values_list(
+            'tax_rate__tax__code', 'override_rate_pct', 'tax_rate__rate_pct',
+        )
+        rates = {}
+        for code, override, base_pct in rows:
+            pct = override if override is not None else (base_pct or Decimal('0.00'))
+            rates[f'{code[:3]}_{pct:.2f}'] = pct
+        return MappingProxyType(rates)
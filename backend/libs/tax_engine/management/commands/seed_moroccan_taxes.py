@@ -0,0 +1,133 @@
+"""Seed the Moroccan tax referential (TVA rates, retenues à la source).
+
+The whole referential is loaded with three ``bulk_create`` calls — one per
+model — instead of per-row ``create()``. The cache-invalidation signals are
+disconnected around the load (each would fire per row) and the affected
+keys are flushed once after commit.
+"""
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.backends.postgresql.psycopg_any import DateRange
+from django.db.models.signals import post_save
+
+from libs.core.models import Company
+from libs.tax_engine import signals
+from libs.tax_engine.models import Tax, TaxRate, TaxRateVersion
+
+# (code, name, type, rate_pct, withheld)
+SEED_TAXES = [
+    ('TVA20', 'TVA taux normal 20%', 'VAT', Decimal('20.00'), False),
+    ('TVA14', 'TVA taux réduit 14%', 'VAT', Decimal('14.00'), False),
+    ('TVA10', 'TVA taux réduit 10%', 'VAT', Decimal('10.00'), False),
+    ('TVA7', 'TVA taux réduit 7%', 'VAT', Decimal('7.00'), False),
+    ('TVA0', 'TVA exonérée 0%', 'VAT', Decimal('0.00'), False),
+    ('RAS_HONORAIRES', 'RAS sur honoraires', 'WITHHOLDING', Decimal('10.00'), True),
+    ('RAS_LOYERS', 'RAS sur loyers', 'WITHHOLDING', Decimal('15.00'), True),
+    ('RAS_INTERETS', 'RAS sur intérêts', 'WITHHOLDING', Decimal('20.00'), True),
+]
+
+
+@contextmanager
+def _invalidation_signals_disconnected():
+    """Silence per-row cache invalidation during the bulk load."""
+    post_save.disconnect(signals.tax_post_save, sender=Tax)
+    post_save.disconnect(signals.tax_rate_changed, sender=TaxRate)
+    post_save.disconnect(signals.tax_rate_version_changed, sender=TaxRateVersion)
+    try:
+        yield
+    finally:
+        post_save.connect(signals.tax_post_save, sender=Tax)
+        post_save.connect(signals.tax_rate_changed, sender=TaxRate)
+        post_save.connect(signals.tax_rate_version_changed, sender=TaxRateVersion)
+
+
+class Command(BaseCommand):
+    help = 'Seed the Moroccan tax referential for a company.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--company', required=True, help='Company ICE')
+        parser.add_argument('--valid-from', default=None,
+                            help='Validity start (YYYY-MM-DD), default Jan 1st of this year')
+
+    def handle(self, *args, **options):
+        try:
+            company = Company.objects.get(ice=options['company'])
+        except Company.DoesNotExist:
+            raise CommandError(f"Unknown company ICE {options['company']!r}")
+
+        valid_from = (
+            date.fromisoformat(options['valid_from'])
+            if options['valid_from'] else date(date.today().year, 1, 1)
+        )
+        valid_to = date(9999, 12, 31)
+
+        with _invalidation_signals_disconnected(), transaction.atomic():
+            taxes = Tax.objects.bulk_create(
+                [
+                    Tax(company=company, code=code, name=name, type=type_,
+                        recoverable=(type_ == 'VAT'))
+                    for code, name, type_, _rate, _wh in SEED_TAXES
+                ],
+                batch_size=500,
+                ignore_conflicts=True,
+            )
+            tax_by_code = {t.code: t for t in Tax.objects.filter(company=company)}
+
+            # Unlike Tax, TaxRate and TaxRateVersion carry no unique
+            # constraint (the overlap rule lives in clean(), which
+            # bulk_create bypasses), so ignore_conflicts cannot make
+            # these INSERTs idempotent; reruns are filtered out
+            # explicitly against the natural keys instead.
+            existing_rates = set(
+                TaxRate.objects.filter(
+                    tax__company=company,
+                ).values_list('tax__code', 'rate_pct')
+            )
+            TaxRate.objects.bulk_create(
+                [
+                    TaxRate(tax=tax_by_code[code], name=name, rate_pct=rate)
+                    for code, name, _type, rate, _wh in SEED_TAXES
+                    if (code, rate) not in existing_rates
+                ],
+                batch_size=500,
+            )
+            rate_by_code = {
+                r.tax.code: r
+                for r in TaxRate.objects.filter(tax__company=company).select_related('tax')
+            }
+
+            # A rate that already has an active version keeps it; seeding
+            # a second open-ended one would leave get_current_rate picking
+            # among overlapping duplicates arbitrarily.
+            versioned_rate_ids = set(
+                TaxRateVersion.raw_objects.filter(
+                    tax_rate__tax__company=company, is_active=True,
+                ).values_list('tax_rate_id', flat=True)
+            )
+            versions = [
+                TaxRateVersion(
+                    tax_rate=rate_by_code[code], company=company,
+                    valid_from=valid_from, valid_to=valid_to,
+                    withheld_flag=withheld,
+                )
+                for code, _name, _type, _rate, withheld in SEED_TAXES
+                if rate_by_code[code].pk not in versioned_rate_ids
+            ]
+            # bulk_create skips save(), so derive the maintained columns by hand.
+            rate_bp = {code: int(rate * 100) for code, _n, _t, rate, _w in SEED_TAXES}
+            for version in versions:
+                version.valid_range = DateRange(valid_from, valid_to, '[]')
+                version.effective_rate_bp = rate_bp[version.tax_rate.tax.code]
+            TaxRateVersion.raw_objects.bulk_create(versions, batch_size=500)
+
+        # One targeted flush replaces the per-row signal invalidation.
+        cache.delete_many(['moroccan_vat_taxes', 'withholding_taxes'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(taxes)} taxes for {company.name}'
+        ))
@@ -0,0 +1,112 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:38
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaxRateVersionHistory',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('tax_rate_id', models.BigIntegerField()),
+                ('company_id', models.BigIntegerField()),
+                ('valid_from', models.DateField()),
+                ('valid_to', models.DateField()),
+                ('override_rate_pct', models.DecimalField(decimal_places=2, max_digits=5, null=True)),
+                ('withheld_flag', models.BooleanField(default=False)),
+                ('withholding_rate_pct', models.DecimalField(decimal_places=2, max_digits=5, null=True)),
+                ('reference', models.CharField(blank=True, max_length=100)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'tax rate version history',
+                'verbose_name_plural': 'tax rate version history',
+                'db_table': 'tax_engine_taxrateversion_history',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Tax',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=20, verbose_name='code')),
+                ('name', models.CharField(max_length=100, verbose_name='name')),
+                ('name_arabic', models.CharField(blank=True, max_length=100, verbose_name='name (arabic)')),
+                ('type', models.CharField(choices=[('VAT', 'Value added tax (TVA)'), ('WITHHOLDING', 'Withholding tax (RAS)'), ('STAMP', 'Stamp duty'), ('REGISTRATION', 'Registration duty')], default='VAT', max_length=20, verbose_name='type')),
+                ('calculation_method', models.CharField(choices=[('PERCENTAGE', 'Percentage of base'), ('FIXED', 'Fixed amount')], default='PERCENTAGE', max_length=20, verbose_name='calculation method')),
+                ('scope', models.CharField(choices=[('ALL', 'All operations'), ('GOODS', 'Goods'), ('SERVICES', 'Services')], default='ALL', max_length=10, verbose_name='scope')),
+                ('recoverable', models.BooleanField(default=True, verbose_name='recoverable')),
+                ('inclusive', models.BooleanField(default=False, verbose_name='price inclusive')),
+                ('is_active', models.BooleanField(default=True, verbose_name='active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='taxes', to='core.company')),
+            ],
+            options={
+                'verbose_name': 'tax',
+                'verbose_name_plural': 'taxes',
+                'ordering': ['code'],
+                'unique_together': {('company', 'code')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TaxRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='name')),
+                ('rate_pct', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.00')), django.core.validators.MaxValueValidator(Decimal('100.00'))], verbose_name='rate (%)')),
+                ('fixed_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.00'))], verbose_name='fixed amount')),
+                ('min_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True, verbose_name='bracket minimum')),
+                ('max_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True, verbose_name='bracket maximum')),
+                ('is_active', models.BooleanField(default=True, verbose_name='active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('tax', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rates', to='tax_engine.tax')),
+            ],
+            options={
+                'verbose_name': 'tax rate',
+                'verbose_name_plural': 'tax rates',
+                'ordering': ['tax', '-rate_pct', '-fixed_amount'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TaxRateVersion',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('valid_from', models.DateField(verbose_name='valid from')),
+                ('valid_to', models.DateField(verbose_name='valid to')),
+                ('override_rate_pct', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.00')), django.core.validators.MaxValueValidator(Decimal('100.00'))], verbose_name='override rate (%)')),
+                ('withheld_flag', models.BooleanField(default=False, verbose_name='withheld at source')),
+                ('withholding_rate_pct', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.00')), django.core.validators.MaxValueValidator(Decimal('100.00'))], verbose_name='withholding rate (%)')),
+                ('reference', models.CharField(blank=True, help_text='e.g. Loi de Finances article', max_length=100, verbose_name='legal reference')),
+                ('is_active', models.BooleanField(default=True, verbose_name='active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tax_rate_versions', to='core.company')),
+                ('tax_rate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='tax_engine.taxrate')),
+            ],
+            options={
+                'verbose_name': 'tax rate version',
+                'verbose_name_plural': 'tax rate versions',
+                'ordering': ['-valid_from'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='taxrate',
+            index=models.Index(fields=['min_amount', 'max_amount'], name='tax_engine__min_amo_badde0_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+"""Temporal history for ``tax_engine_taxrateversion``.
+
+History rows are written by the ``temporal_tables`` C extension inside the
+same transaction as the triggering statement, replacing the per-row Python
+history writes ``simple_history`` would perform. Bulk imports therefore pay
+no application-side history overhead.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tax_engine', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+            CREATE EXTENSION IF NOT EXISTS temporal_tables;
+
+            ALTER TABLE tax_engine_taxrateversion
+                ADD COLUMN sys_period tstzrange
+                NOT NULL DEFAULT tstzrange(current_timestamp, null);
+
+            CREATE TABLE tax_engine_taxrateversion_history
+                (LIKE tax_engine_taxrateversion);
+
+            CREATE TRIGGER versioning_trigger
+                BEFORE INSERT OR UPDATE OR DELETE
+                ON tax_engine_taxrateversion
+                FOR EACH ROW EXECUTE PROCEDURE versioning(
+                    'sys_period', 'tax_engine_taxrateversion_history', true
+                );
+            """,
+            reverse_sql="""
+            DROP TRIGGER IF EXISTS versioning_trigger ON tax_engine_taxrateversion;
+            DROP TABLE IF EXISTS tax_engine_taxrateversion_history;
+            ALTER TABLE tax_engine_taxrateversion DROP COLUMN IF EXISTS sys_period;
+            """,
+        ),
+    ]
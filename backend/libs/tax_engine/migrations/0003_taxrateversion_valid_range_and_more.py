@@ -0,0 +1,40 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:39
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('tax_engine', '0002_taxrateversion_temporal_history'),
+    ]
+
+    operations = [
+        # The exclusion constraint mixes = on a FK with && on a range.
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name='taxrateversion',
+            name='valid_range',
+            field=django.contrib.postgres.fields.ranges.DateRangeField(editable=False, null=True, verbose_name='validity'),
+        ),
+        migrations.RunSQL(
+            sql="""
+            UPDATE tax_engine_taxrateversion
+               SET valid_range = daterange(valid_from, valid_to, '[]');
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='taxrateversion',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['tax_rate', 'valid_range'], name='taxrateversion_range_gist'),
+        ),
+        migrations.AddConstraint(
+            model_name='taxrateversion',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('is_active', True)), expressions=[('tax_rate', '='), ('valid_range', '&&')], name='taxrateversion_no_overlap'),
+        ),
+    ]
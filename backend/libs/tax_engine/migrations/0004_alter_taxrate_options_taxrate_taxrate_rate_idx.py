@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tax_engine', '0003_taxrateversion_valid_range_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='taxrate',
+            options={'ordering': ['tax', '-rate_pct'], 'verbose_name': 'tax rate', 'verbose_name_plural': 'tax rates'},
+        ),
+        migrations.AddIndex(
+            model_name='taxrate',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['tax', '-rate_pct'], name='taxrate_rate_idx'),
+        ),
+    ]
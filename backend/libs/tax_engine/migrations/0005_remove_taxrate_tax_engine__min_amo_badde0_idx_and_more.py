@@ -0,0 +1,36 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:42
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tax_engine', '0004_alter_taxrate_options_taxrate_taxrate_rate_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='taxrate',
+            name='tax_engine__min_amo_badde0_idx',
+        ),
+        migrations.AddField(
+            model_name='taxrate',
+            name='amount_range',
+            field=django.contrib.postgres.fields.ranges.DecimalRangeField(editable=False, null=True, verbose_name='bracket'),
+        ),
+        migrations.RunSQL(
+            sql="""
+            UPDATE tax_engine_taxrate
+               SET amount_range = numrange(min_amount, max_amount, '[]')
+             WHERE min_amount IS NOT NULL OR max_amount IS NOT NULL;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='taxrate',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['amount_range'], name='taxrate_amount_range_gist'),
+        ),
+    ]
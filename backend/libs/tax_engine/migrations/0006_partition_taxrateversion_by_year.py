@@ -0,0 +1,86 @@
+"""Range-partition ``tax_engine_taxrateversion`` by ``valid_from`` year.
+
+Date-filtered probes now only touch the partitions whose ``valid_from``
+can match, keeping per-probe index size flat as history accumulates.
+
+Two Postgres constraints shape the rebuild:
+
+* the primary key of a partitioned table must contain the partition key,
+  so the PK becomes ``(id, valid_from)`` — ``id`` stays globally unique in
+  practice (uuid) and the ORM is unaffected;
+* exclusion constraints are not supported on partitioned parents, so the
+  ``taxrateversion_no_overlap`` constraint is dropped here and the overlap
+  rule is enforced in ``TaxRateVersion.clean()`` instead.
+"""
+from django.db import migrations
+
+
+_REBUILD_SQL = """
+ALTER TABLE tax_engine_taxrateversion RENAME TO tax_engine_taxrateversion_flat;
+DROP TRIGGER IF EXISTS versioning_trigger ON tax_engine_taxrateversion_flat;
+
+CREATE TABLE tax_engine_taxrateversion
+    (LIKE tax_engine_taxrateversion_flat INCLUDING DEFAULTS)
+    PARTITION BY RANGE (valid_from);
+
+ALTER TABLE tax_engine_taxrateversion
+    ADD PRIMARY KEY (id, valid_from);
+ALTER TABLE tax_engine_taxrateversion
+    ADD FOREIGN KEY (tax_rate_id)
+        REFERENCES tax_engine_taxrate (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE tax_engine_taxrateversion
+    ADD FOREIGN KEY (company_id)
+        REFERENCES core_company (id) DEFERRABLE INITIALLY DEFERRED;
+
+DO $$
+DECLARE y integer;
+BEGIN
+    FOR y IN 2015..2035 LOOP
+        EXECUTE format(
+            'CREATE TABLE tax_engine_taxrateversion_y%s '
+            'PARTITION OF tax_engine_taxrateversion '
+            'FOR VALUES FROM (%L) TO (%L)',
+            y, make_date(y, 1, 1), make_date(y + 1, 1, 1)
+        );
+    END LOOP;
+END $$;
+CREATE TABLE tax_engine_taxrateversion_default
+    PARTITION OF tax_engine_taxrateversion DEFAULT;
+
+INSERT INTO tax_engine_taxrateversion
+    SELECT * FROM tax_engine_taxrateversion_flat;
+DROP TABLE tax_engine_taxrateversion_flat;
+
+CREATE INDEX taxrateversion_range_gist
+    ON tax_engine_taxrateversion USING gist (tax_rate_id, valid_range);
+CREATE INDEX tax_engine_taxrateversion_company_id
+    ON tax_engine_taxrateversion (company_id);
+
+CREATE TRIGGER versioning_trigger
+    BEFORE INSERT OR UPDATE OR DELETE
+    ON tax_engine_taxrateversion
+    FOR EACH ROW EXECUTE PROCEDURE versioning(
+        'sys_period', 'tax_engine_taxrateversion_history', true
+    );
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tax_engine', '0005_remove_taxrate_tax_engine__min_amo_badde0_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveConstraint(
+                    model_name='taxrateversion',
+                    name='taxrateversion_no_overlap',
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(sql=_REBUILD_SQL, reverse_sql=migrations.RunSQL.noop),
+            ],
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:45
+
+import uuid_utils.compat
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tax_engine', '0006_partition_taxrateversion_by_year'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='taxrateversion',
+            name='id',
+            field=models.UUIDField(default=uuid_utils.compat.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
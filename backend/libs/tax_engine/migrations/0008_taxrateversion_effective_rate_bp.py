@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tax_engine', '0007_alter_taxrateversion_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taxrateversion',
+            name='effective_rate_bp',
+            field=models.IntegerField(default=0, editable=False, verbose_name='effective rate (bp)'),
+        ),
+        migrations.RunSQL(
+            sql="""
+            UPDATE tax_engine_taxrateversion v
+               SET effective_rate_bp = (
+                   COALESCE(v.override_rate_pct, r.rate_pct, 0) * 100
+               )::integer
+              FROM tax_engine_taxrate r
+             WHERE r.id = v.tax_rate_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_documentsequence'),
+        ('tax_engine', '0008_taxrateversion_effective_rate_bp'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='taxrateversion',
+            index=models.Index(fields=['tax_rate', 'is_active', 'valid_from', 'valid_to'], name='taxrateversion_validity_idx'),
+        ),
+    ]
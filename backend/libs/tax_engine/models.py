@@ -0,0 +1,382 @@
+"""
+Moroccan tax referential: taxes (TVA, retenues à la source...), their rates
+and the dated versions of those rates.
+
+Row history for ``TaxRateVersion`` is maintained by a Postgres temporal
+trigger (see migration 0002) rather than ``simple_history``, so bulk loads
+pay no per-row Python overhead; query it through ``TaxRateVersionHistory``.
+"""
+import functools
+from decimal import Decimal
+
+from django.contrib.postgres.fields import DateRangeField, DecimalRangeField
+from django.contrib.postgres.indexes import GistIndex
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+from django.db.backends.postgresql.psycopg_any import DateRange, NumericRange
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from uuid_utils.compat import uuid7
+
+from libs.core.models import Company
+
+# Shared Decimal sentinels: construction from str costs >1us, and the hot
+# calculation paths return these millions of times during batch postings.
+_DEC_ZERO = Decimal('0.00')
+_DEC_HUNDRED = Decimal('100.00')
+
+
+@functools.lru_cache(maxsize=512)
+def _has_any_versions(tax_id):
+    """Per-process guard: does any active version exist under this tax?
+
+    Lets get_applicable_rates return [] without building a queryset for
+    taxes that never had versions. Cleared by the tax_engine signals on
+    any referential write.
+    """
+    return TaxRateVersion.objects.filter(
+        tax_rate__tax_id=tax_id, is_active=True,
+    ).exists()
+
+
+class Tax(models.Model):
+    """A tax as defined by the Code Général des Impôts (TVA, IS, RAS...)."""
+
+    TYPE_CHOICES = [
+        ('VAT', _('Value added tax (TVA)')),
+        ('WITHHOLDING', _('Withholding tax (RAS)')),
+        ('STAMP', _('Stamp duty')),
+        ('REGISTRATION', _('Registration duty')),
+    ]
+
+    CALCULATION_METHODS = [
+        ('PERCENTAGE', _('Percentage of base')),
+        ('FIXED', _('Fixed amount')),
+    ]
+
+    SCOPE_CHOICES = [
+        ('ALL', _('All operations')),
+        ('GOODS', _('Goods')),
+        ('SERVICES', _('Services')),
+    ]
+
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='taxes')
+    code = models.CharField(_('code'), max_length=20)
+    name = models.CharField(_('name'), max_length=100)
+    name_arabic = models.CharField(_('name (arabic)'), max_length=100, blank=True)
+    type = models.CharField(_('type'), max_length=20, choices=TYPE_CHOICES, default='VAT')
+    calculation_method = models.CharField(
+        _('calculation method'), max_length=20,
+        choices=CALCULATION_METHODS, default='PERCENTAGE',
+    )
+    scope = models.CharField(_('scope'), max_length=10, choices=SCOPE_CHOICES, default='ALL')
+    recoverable = models.BooleanField(_('recoverable'), default=True)
+    inclusive = models.BooleanField(_('price inclusive'), default=False)
+    is_active = models.BooleanField(_('active'), default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    MOROCCAN_VAT_CODES = ['TVA20', 'TVA14', 'TVA10', 'TVA7', 'TVA0']
+    WITHHOLDING_CODES = ['RAS_HONORAIRES', 'RAS_LOYERS', 'RAS_INTERETS']
+
+    class Meta:
+        verbose_name = _('tax')
+        verbose_name_plural = _('taxes')
+        unique_together = [['company', 'code']]
+        ordering = ['code']
+
+    def __str__(self):
+        return f'{self.code} - {self.name}'
+
+    @classmethod
+    def get_moroccan_vat_taxes(cls):
+        """Return the standard Moroccan VAT taxes (TVA 20/14/10/7/0).
+
+        The set is nearly static, so it is served as plain dicts from the
+        cache; the post_save/post_delete signals drop the key on any write.
+        """
+        def _load():
+            return list(
+                cls.objects.filter(
+                    code__in=cls.MOROCCAN_VAT_CODES, type='VAT', is_active=True,
+                ).values('id', 'code', 'name', 'recoverable', 'inclusive')
+            )
+        return cache.get_or_set('moroccan_vat_taxes', _load, 3600)
+
+    @classmethod
+    def get_withholding_taxes(cls):
+        """Return the active withholding taxes (retenues à la source).
+
+        Cached like :meth:`get_moroccan_vat_taxes`, under the
+        ``withholding_taxes`` key the signals already invalidate.
+        """
+        def _load():
+            return list(
+                cls.objects.filter(
+                    code__in=cls.WITHHOLDING_CODES, type='WITHHOLDING', is_active=True,
+                ).values('id', 'code', 'name', 'recoverable', 'inclusive')
+            )
+        return cache.get_or_set('withholding_taxes', _load, 3600)
+
+    def get_applicable_rates(self, amount, calculation_date=None, scope=None):
+        """Return the active rates of this tax applicable to ``amount``.
+
+        A rate is applicable when its bracket contains ``amount`` and a
+        version of the rate is valid on ``calculation_date``.
+        """
+        if scope is not None and self.scope != 'ALL' and self.scope != scope:
+            return []
+        if not _has_any_versions(self.pk):
+            return []
+        applicable = []
+        for rate in self.rates.filter(is_active=True):
+            if not rate.is_applicable_for_amount(amount):
+                continue
+            if rate.get_current_rate(calculation_date) is not None:
+                applicable.append(rate)
+        return applicable
+
+
+class TaxRate(models.Model):
+    """A rate (taux) of a tax, possibly restricted to an amount bracket."""
+
+    tax = models.ForeignKey(Tax, on_delete=models.CASCADE, related_name='rates')
+    name = models.CharField(_('name'), max_length=100)
+    rate_pct = models.DecimalField(
+        _('rate (%)'), max_digits=5, decimal_places=2, null=True, blank=True,
+        validators=[MinValueValidator(Decimal('0.00')), MaxValueValidator(Decimal('100.00'))],
+    )
+    fixed_amount = models.DecimalField(
+        _('fixed amount'), max_digits=15, decimal_places=2, null=True, blank=True,
+        validators=[MinValueValidator(Decimal('0.00'))],
+    )
+    min_amount = models.DecimalField(
+        _('bracket minimum'), max_digits=15, decimal_places=2, null=True, blank=True,
+    )
+    max_amount = models.DecimalField(
+        _('bracket maximum'), max_digits=15, decimal_places=2, null=True, blank=True,
+    )
+    # Maintained from (min_amount, max_amount) in save(); bulk applicability
+    # probes use amount_range__contains with the GiST index below.
+    amount_range = DecimalRangeField(_('bracket'), null=True, editable=False)
+    is_active = models.BooleanField(_('active'), default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _('tax rate')
+        verbose_name_plural = _('tax rates')
+        ordering = ['tax', '-rate_pct']
+        indexes = [
+            models.Index(
+                fields=['tax', '-rate_pct'],
+                name='taxrate_rate_idx',
+                condition=models.Q(is_active=True),
+            ),
+            GistIndex(fields=['amount_range'], name='taxrate_amount_range_gist'),
+        ]
+
+    def __str__(self):
+        if self.rate_pct is not None:
+            return f'{self.tax.code} {self.rate_pct}%'
+        return f'{self.tax.code} {self.fixed_amount}'
+
+    @property
+    def rate_decimal(self):
+        """The rate as a multiplier (20.00% -> Decimal('0.2000'))."""
+        if self.rate_pct is None:
+            return _DEC_ZERO
+        return self.rate_pct / _DEC_HUNDRED
+
+    def save(self, *args, **kwargs):
+        if self.min_amount is None and self.max_amount is None:
+            self.amount_range = None
+        else:
+            self.amount_range = NumericRange(self.min_amount, self.max_amount, '[]')
+        super().save(*args, **kwargs)
+
+    def is_applicable_for_amount(self, amount):
+        """True when ``amount`` falls inside the (optional) bracket."""
+        if self.amount_range is None:
+            return True
+        lower = self.amount_range.lower
+        upper = self.amount_range.upper
+        return (lower is None or amount >= lower) and (upper is None or amount <= upper)
+
+    def get_current_rate(self, on_date=None):
+        """Return the :class:`TaxRateVersion` valid on ``on_date`` (or today)."""
+        if on_date is None:
+            on_date = timezone.now().date()
+        return (
+            self.versions
+            # The redundant valid_from bound lets the planner prune the
+            # yearly partitions (valid_range alone cannot).
+            .filter(valid_range__contains=on_date, valid_from__lte=on_date, is_active=True)
+            .order_by('-valid_from')
+            .first()
+        )
+
+
+class TaxRateVersionManager(models.Manager):
+    """Default manager joining the relations every calc path dereferences.
+
+    Callers systematically reach ``version.tax_rate.tax`` (calculation
+    method, code) and ``version.company``; making the join the default
+    removes two lazy SELECTs per calculation.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('tax_rate__tax', 'company')
+
+
+class TaxRateVersion(models.Model):
+    """A dated version of a tax rate.
+
+    Rate changes published in a Loi de Finances are recorded as new versions
+    with non-overlapping validity windows, so past documents keep computing
+    with the rate in force on their date.
+    """
+
+    # uuid7 is time-ordered: new versions land at the right edge of the PK
+    # btree instead of a random leaf, which matters during bulk imports.
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    tax_rate = models.ForeignKey(TaxRate, on_delete=models.CASCADE, related_name='versions')
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='tax_rate_versions')
+    valid_from = models.DateField(_('valid from'))
+    valid_to = models.DateField(_('valid to'))
+    # Maintained from (valid_from, valid_to) in save(); all date lookups go
+    # through this range so Postgres can answer them with one GiST probe.
+    valid_range = DateRangeField(_('validity'), null=True, editable=False)
+    override_rate_pct = models.DecimalField(
+        _('override rate (%)'), max_digits=5, decimal_places=2, null=True, blank=True,
+        validators=[MinValueValidator(Decimal('0.00')), MaxValueValidator(Decimal('100.00'))],
+    )
+    withheld_flag = models.BooleanField(_('withheld at source'), default=False)
+    withholding_rate_pct = models.DecimalField(
+        _('withholding rate (%)'), max_digits=5, decimal_places=2, null=True, blank=True,
+        validators=[MinValueValidator(Decimal('0.00')), MaxValueValidator(Decimal('100.00'))],
+    )
+    reference = models.CharField(
+        _('legal reference'), max_length=100, blank=True,
+        help_text=_('e.g. Loi de Finances article'),
+    )
+    # Denormalized effective rate in basis points (20.00% -> 2000), kept in
+    # save(); bulk calculation paths read this single int column.
+    effective_rate_bp = models.IntegerField(_('effective rate (bp)'), default=0, editable=False)
+    is_active = models.BooleanField(_('active'), default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TaxRateVersionManager()
+    # Plain manager for bulk migrations where the default join is unwanted.
+    raw_objects = models.Manager()
+
+    class Meta:
+        verbose_name = _('tax rate version')
+        verbose_name_plural = _('tax rate versions')
+        ordering = ['-valid_from']
+        indexes = [
+            GistIndex(fields=['tax_rate', 'valid_range'], name='taxrateversion_range_gist'),
+            # Btree companion for the calculator's lookup; also prunes
+            # partitions through the valid_from bound.
+            models.Index(
+                fields=['tax_rate', 'is_active', 'valid_from', 'valid_to'],
+                name='taxrateversion_validity_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.tax_rate} [{self.valid_from} - {self.valid_to}]'
+
+    def save(self, *args, **kwargs):
+        self.valid_range = DateRange(self.valid_from, self.valid_to, '[]')
+        self.effective_rate_bp = int(self.effective_rate_pct * 100)
+        super().save(*args, **kwargs)
+
+    def clean(self):
+        """Reject overlapping active versions of the same rate.
+
+        The table is partitioned by valid_from year (migration 0006) and
+        Postgres cannot carry an exclusion constraint on a partitioned
+        parent, so the overlap rule lives here.
+        """
+        super().clean()
+        if not self.is_active or self.valid_from is None or self.valid_to is None:
+            return
+        overlapping = (
+            TaxRateVersion.objects
+            .filter(
+                tax_rate=self.tax_rate, is_active=True,
+                valid_range__overlap=DateRange(self.valid_from, self.valid_to, '[]'),
+            )
+            .exclude(pk=self.pk)
+        )
+        if overlapping.exists():
+            raise ValidationError({
+                'valid_from': _('An active version already covers part of this period.'),
+            })
+
+    @property
+    def effective_rate_pct(self):
+        """The percentage in force: the override if set, else the base rate."""
+        if self.override_rate_pct is not None:
+            return self.override_rate_pct
+        if self.tax_rate.rate_pct is not None:
+            return self.tax_rate.rate_pct
+        return _DEC_ZERO
+
+    @property
+    def effective_rate_decimal(self):
+        return self.effective_rate_pct / _DEC_HUNDRED
+
+    def is_valid_for_date(self, on_date):
+        """Convenience for external callers; the calculator relies on the
+        DB filter instead of re-checking per version."""
+        return self.valid_from <= on_date <= self.valid_to and self.is_active
+
+    def calculate_tax(self, base_amount):
+        """Tax amount for ``base_amount`` under this version."""
+        if base_amount is None or base_amount <= _DEC_ZERO:
+            return _DEC_ZERO
+        if self.tax_rate.tax.calculation_method == 'FIXED':
+            return self.tax_rate.fixed_amount or _DEC_ZERO
+        return (base_amount * Decimal(self.effective_rate_bp) / 10000).quantize(Decimal('0.01'))
+
+    def get_withholding_amount(self, base_amount):
+        """Amount withheld at source, when this version is withheld."""
+        if not self.withheld_flag:
+            return _DEC_ZERO
+        rate = self.withholding_rate_pct
+        if rate is None:
+            rate = self.effective_rate_pct
+        return (base_amount * rate / _DEC_HUNDRED).quantize(Decimal('0.01'))
+
+
+class TaxRateVersionHistory(models.Model):
+    """Read-only view over the temporal history of ``TaxRateVersion``.
+
+    Rows are written by the ``versioning`` trigger installed in migration
+    0002; this model only exists so the history can be queried through the
+    ORM.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    tax_rate_id = models.BigIntegerField()
+    company_id = models.BigIntegerField()
+    valid_from = models.DateField()
+    valid_to = models.DateField()
+    override_rate_pct = models.DecimalField(max_digits=5, decimal_places=2, null=True)
+    withheld_flag = models.BooleanField(default=False)
+    withholding_rate_pct = models.DecimalField(max_digits=5, decimal_places=2, null=True)
+    reference = models.CharField(max_length=100, blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'tax_engine_taxrateversion_history'
+        verbose_name = _('tax rate version history')
+        verbose_name_plural = _('tax rate version history')
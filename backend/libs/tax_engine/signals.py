@@ -0,0 +1,87 @@
+"""Cache invalidation for the tax referential.
+
+The calculator and the API cache tax lookups aggressively; any write to the
+referential flushes the affected keys.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Tax, TaxRate, TaxRateVersion, _has_any_versions
+
+
+def _tax_cache_keys(instance):
+    return [
+        'moroccan_vat_taxes',
+        'withholding_taxes',
+        f'tax_{instance.pk}',
+    ]
+
+
+def _delete_keys_chunked(id_qs, key_format, chunk_size=5000, batch=500):
+    """Stream ids and flush their cache keys in bounded delete_many batches.
+
+    Mass tax-law updates can cascade over thousands of versions;
+    iterator() keeps memory flat and batches of 500 keys keep each
+    pipelined DEL under the Redis buffer limit.
+    """
+    buf = []
+    for row_id in id_qs.iterator(chunk_size=chunk_size):
+        buf.append(key_format.format(row_id))
+        if len(buf) >= batch:
+            cache.delete_many(buf)
+            buf.clear()
+    if buf:
+        cache.delete_many(buf)
+
+
+def _invalidate_tax_cascade(instance):
+    """Flush per-rate and per-version keys under a tax in batched DELs.
+
+    Invalidating only the tax's own keys leaves stale per-rate/per-version
+    entries behind; streaming values_list per level plus batched
+    delete_many beats per-key round-trips.
+    """
+    _delete_keys_chunked(
+        TaxRate.objects.filter(tax=instance).values_list('id', flat=True),
+        'tax_rate_{}',
+    )
+    _delete_keys_chunked(
+        TaxRateVersion.objects.filter(tax_rate__tax=instance).values_list('id', flat=True),
+        'tax_rate_version_{}',
+    )
+    _has_any_versions.cache_clear()
+
+
+@receiver(post_save, sender=Tax)
+def tax_post_save(sender, instance, **kwargs):
+    cache.delete_many(_tax_cache_keys(instance))
+    _invalidate_tax_cascade(instance)
+
+
+@receiver(post_delete, sender=Tax)
+def tax_post_delete(sender, instance, **kwargs):
+    cache.delete_many(_tax_cache_keys(instance))
+    _invalidate_tax_cascade(instance)
+
+
+@receiver(post_save, sender=TaxRate)
+@receiver(post_delete, sender=TaxRate)
+def tax_rate_changed(sender, instance, **kwargs):
+    cache.delete_many([
+        f'tax_rate_{instance.pk}',
+        f'tax_{instance.tax_id}',
+    ])
+
+
+@receiver(post_save, sender=TaxRateVersion)
+@receiver(post_delete, sender=TaxRateVersion)
+def tax_rate_version_changed(sender, instance, **kwargs):
+    from .calculator import TaxCalculator
+
+    cache.delete_many([
+        f'tax_rate_version_{instance.pk}',
+        f'tax_rate_{instance.tax_rate_id}',
+    ])
+    _has_any_versions.cache_clear()
+    TaxCalculator._moroccan_tax_rates.cache_clear()
@@ -0,0 +1,184 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db.backends.postgresql.psycopg_any import DateRange
+from django.test import TestCase
+
+from libs.core.models import Company
+
+from .calculator import TaxCalculator, TaxLineItem
+from .models import Tax, TaxRate, TaxRateVersion
+
+_FOREVER = date(9999, 12, 31)
+
+
+def _version(tax_rate, company, **kwargs):
+    """Build an unsaved version with the save()-maintained columns set,
+    so the fixtures can go through bulk_create."""
+    version = TaxRateVersion(
+        tax_rate=tax_rate, company=company,
+        valid_from=date(2024, 1, 1), valid_to=_FOREVER, **kwargs,
+    )
+    version.valid_range = DateRange(version.valid_from, version.valid_to, '[]')
+    version.effective_rate_bp = int(version.effective_rate_pct * 100)
+    return version
+
+
+class TaxCalculatorTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = Company.objects.create(name='Atlas SARL', ice='001234567000089')
+        cls.tva, cls.ras = Tax.objects.bulk_create([
+            Tax(company=cls.company, code='TVA20', name='TVA taux normal',
+                type='VAT'),
+            Tax(company=cls.company, code='RAS_HONORAIRES',
+                name='RAS sur honoraires', type='WITHHOLDING'),
+        ])
+        cls.rate_20, cls.rate_ras = TaxRate.objects.bulk_create([
+            TaxRate(tax=cls.tva, name='TVA 20%', rate_pct=Decimal('20.00')),
+            TaxRate(tax=cls.ras, name='RAS 10%', rate_pct=Decimal('10.00')),
+        ])
+        cls.version_20, cls.version_ras = TaxRateVersion.raw_objects.bulk_create([
+            _version(cls.rate_20, cls.company),
+            _version(cls.rate_ras, cls.company,
+                     withheld_flag=True, withholding_rate_pct=Decimal('10.00')),
+        ])
+        # Shared across tests: construction primes the rate table with a
+        # query, so build it once with the fixtures. Tests only touch the
+        # mutable attributes, reset below.
+        cls.calculator = TaxCalculator(
+            company=cls.company, calculation_date=date(2024, 6, 15),
+        )
+
+    def setUp(self):
+        self.calculator.inclusive_taxes = False
+
+    def test_create_tax_rate(self):
+        self.assertEqual(self.rate_20.rate_pct, Decimal('20.00'))
+        self.assertEqual(self.rate_20.rate_decimal, Decimal('0.2'))
+
+    def test_calculate_line_taxes(self):
+        line = TaxLineItem(
+            description='Prestation', quantity=Decimal('2'),
+            unit_price=Decimal('500.00'), tax_rates=[self.rate_20],
+        )
+        result = self.calculator.calculate_line_taxes(line)
+        self.assertEqual(result.base_amount, Decimal('1000.00'))
+        self.assertEqual(result.tax_amount, Decimal('200.00'))
+        self.assertEqual(result.total_amount, Decimal('1200.00'))
+
+    def test_calculate_line_taxes_with_discount(self):
+        line = TaxLineItem(
+            description='Prestation', quantity=Decimal('1'),
+            unit_price=Decimal('1000.00'), discount_percent=Decimal('10.00'),
+            tax_rates=[self.rate_20],
+        )
+        result = self.calculator.calculate_line_taxes(line)
+        self.assertEqual(result.base_amount, Decimal('900.00'))
+        self.assertEqual(result.tax_amount, Decimal('180.00'))
+
+    def test_calculate_withholding(self):
+        line = TaxLineItem(
+            description='Honoraires', quantity=Decimal('1'),
+            unit_price=Decimal('10000.00'), tax_rates=[self.rate_ras],
+        )
+        result = self.calculator.calculate_line_taxes(line)
+        self.assertEqual(result.withheld_amount, Decimal('1000.00'))
+        self.assertEqual(result.total_amount, Decimal('9000.00'))
+
+    def test_calculate_document_taxes(self):
+        lines = [
+            TaxLineItem(description='A', quantity=Decimal('1'),
+                        unit_price=Decimal('100.00'), tax_rates=[self.rate_20]),
+            TaxLineItem(description='B', quantity=Decimal('3'),
+                        unit_price=Decimal('50.00'), tax_rates=[self.rate_20]),
+        ]
+        result = self.calculator.calculate_document_taxes(lines)
+        self.assertEqual(result.total_base, Decimal('250.00'))
+        self.assertEqual(result.total_tax, Decimal('50.00'))
+        self.assertEqual(result.total_amount, Decimal('300.00'))
+        self.assertEqual(len(result.lines), 2)
+
+    def test_calculate_inclusive_taxes(self):
+        self.calculator.inclusive_taxes = True
+        line = TaxLineItem(
+            description='TTC', quantity=Decimal('1'),
+            unit_price=Decimal('1200.00'), tax_rates=[self.rate_20],
+        )
+        result = self.calculator.calculate_line_taxes(line)
+        self.assertEqual(result.base_amount, Decimal('1000.00'))
+        self.assertEqual(result.tax_amount, Decimal('200.00'))
+        # The details are computed from the backed-out base, not the
+        # tax-inclusive price, so they sum to the line's tax amount.
+        self.assertEqual(
+            result.tax_details,
+            [(self.rate_20.id, Decimal('20.00'), Decimal('200.00'), False)],
+        )
+
+    def test_calculate_inclusive_taxes_with_withholding(self):
+        self.calculator.inclusive_taxes = True
+        line = TaxLineItem(
+            description='Honoraires TTC', quantity=Decimal('1'),
+            unit_price=Decimal('1200.00'),
+            tax_rates=[self.rate_20, self.rate_ras],
+        )
+        result = self.calculator.calculate_line_taxes(line)
+        # The withheld rate does not inflate the price, so only the TVA
+        # backs out of the total; the RAS applies to the HT base.
+        self.assertEqual(result.base_amount, Decimal('1000.00'))
+        self.assertEqual(result.tax_amount, Decimal('200.00'))
+        self.assertEqual(result.withheld_amount, Decimal('100.00'))
+        self.assertEqual(result.total_amount, Decimal('1100.00'))
+        self.assertEqual(
+            result.tax_details,
+            [(self.rate_20.id, Decimal('20.00'), Decimal('200.00'), False),
+             (self.rate_ras.id, Decimal('10.00'), Decimal('100.00'), True)],
+        )
+
+    def test_tax_rate_versioning(self):
+        self.version_20.is_active = True
+        self.version_20.override_rate_pct = Decimal('19.00')
+        self.version_20.save()
+        self.assertEqual(self.version_20.effective_rate_pct, Decimal('19.00'))
+        calculator = TaxCalculator(
+            company=self.company, calculation_date=date(2024, 6, 15),
+        )
+        line = TaxLineItem(
+            description='Prestation', quantity=Decimal('1'),
+            unit_price=Decimal('100.00'), tax_rates=[self.rate_20],
+        )
+        result = calculator.calculate_line_taxes(line)
+        self.assertEqual(result.tax_amount, Decimal('19.00'))
+
+    def test_date_versioning(self):
+        self.version_20.valid_to = date(2024, 12, 31)
+        self.version_20.save()
+        TaxRateVersion.objects.create(
+            tax_rate=self.rate_20, company=self.company,
+            valid_from=date(2025, 1, 1), valid_to=_FOREVER,
+            override_rate_pct=Decimal('22.00'),
+        )
+        calculator = TaxCalculator(
+            company=self.company, calculation_date=date(2025, 3, 1),
+        )
+        line = TaxLineItem(
+            description='Prestation', quantity=Decimal('1'),
+            unit_price=Decimal('100.00'), tax_rates=[self.rate_20],
+        )
+        result = calculator.calculate_line_taxes(line)
+        self.assertEqual(result.tax_amount, Decimal('22.00'))
+
+    def test_rounding(self):
+        line = TaxLineItem(
+            description='Arrondi', quantity=Decimal('3'),
+            unit_price=Decimal('33.333'), tax_rates=[self.rate_20],
+        )
+        result = self.calculator.calculate_line_taxes(line)
+        self.assertEqual(result.base_amount.as_tuple().exponent, -2)
+        self.assertEqual(result.tax_amount.as_tuple().exponent, -2)
+
+    def test_moroccan_tax_rates(self):
+        rates = TaxCalculator.get_moroccan_tax_rates(date(2024, 6, 15))
+        self.assertIn('TVA_20.00', rates)
+        self.assertEqual(rates['TVA_20.00'], Decimal('20.00'))